@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import text
 from app.db.session import get_session  # 프로젝트 경로에 맞게
 
 router = APIRouter()
@@ -8,7 +8,7 @@ router = APIRouter()
 @router.get("/z")
 async def healthz(db: AsyncSession = Depends(get_session)):
     try:
-        await db.execute(select(1))
+        await db.execute(text("SELECT 1"))
         return {"ok": True}
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -37,14 +37,23 @@
 # (필요 시 확장) 카테고리 정규화/표시 순서 유틸
 DISPLAY_CATEGORIES = ["경제", "정치", "사회", "문화", "세계", "과학"]
 
+# 기사 ID 접두어(3자) → 표시 카테고리
+_PREFIX_MAP = {
+    "eco": "경제",
+    "pol": "정치",
+    "soc": "사회",
+    "lif": "문화",
+    "sci": "과학",
+    "int": "세계",
+}
+
+# 원본 category 값 → 표시 카테고리 (접두어로 못 정할 때)
+_CATEGORY_MAP = {
+    "생활/문화": "문화",
+    "IT/과학": "과학",
+    "IT": "과학",
+    "국제": "세계",
+}
+
 def normalize_category(article_id: str, category: str | None) -> str:
-    if article_id.startswith("eco"): return "경제"
-    if article_id.startswith("pol"): return "정치"
-    if article_id.startswith("soc"): return "사회"
-    if article_id.startswith("lif"): return "문화"
-    if article_id.startswith("sci"): return "과학"
-    if article_id.startswith("int"): return "세계"
-    if category in ("생활/문화",): return "문화"
-    if category in ("IT/과학", "IT"): return "과학"
-    if category in ("국제",): return "세계"
-    return category or "기타"
+    return _PREFIX_MAP.get(article_id[:3]) or _CATEGORY_MAP.get(category) or category or "기타"
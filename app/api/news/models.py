@@ -17,6 +17,32 @@ class Article(SQLModel, table=True):
     keywords: Optional[str] = None
     scraped_at: Optional[datetime] = None
 
+# 목록 조회용 인덱스(category/press/published_at)는 `python -m app.db.migrate` 에서
+# CREATE INDEX CONCURRENTLY 로 적용 (앱 부팅 시 큰 테이블 인덱싱으로 쓰기를 막지 않도록)
+
+# 표시 카테고리 라벨(생성 컬럼): ID 접두어 → 원본 category 정규화 → category/'기타'
+#  - 조회 쿼리마다 ILIKE/CASE를 돌리지 않도록 저장 시점에 계산
+#  - 모델 필드로 두지 않음: 컬럼이 없는 DB에서도 ORM 조회가 깨지지 않게 서비스에서 존재 여부를 확인 후 사용
+#  - 컬럼 추가는 테이블 전체를 다시 쓰므로(ACCESS EXCLUSIVE) 앱 부팅이 아니라
+#    `python -m app.db.migrate` 에서만 적용 (인덱스 포함)
+ARTICLE_LABEL_DDL = """
+    CASE lower(substring(id from 1 for 3))
+      WHEN 'eco' THEN '경제'
+      WHEN 'pol' THEN '정치'
+      WHEN 'soc' THEN '사회'
+      WHEN 'lif' THEN '문화'
+      WHEN 'sci' THEN '과학'
+      WHEN 'int' THEN '세계'
+      ELSE CASE
+        WHEN category IN ('문화','생활/문화') THEN '문화'
+        WHEN category IN ('과학','IT/과학','IT') THEN '과학'
+        WHEN category IN ('국제','세계') THEN '세계'
+        WHEN category IN ('경제','정치','사회') THEN category
+        ELSE COALESCE(category, '기타')
+      END
+    END
+"""
+
 class ArticleRead(SQLModel, table=True):
     __tablename__ = "article_reads"
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -26,6 +52,9 @@ class ArticleRead(SQLModel, table=True):
     closed_at: Optional[datetime] = None
     dwell_seconds: Optional[int] = 0
 
+# 사용자별 기간 조회(user_id + opened_at, 집계 컬럼 INCLUDE) 인덱스와
+# sentiment_articles(감정분석 서비스 소유 테이블) 조인 키 인덱스는 `python -m app.db.migrate` 에서 적용
+
 class UserEvent(SQLModel, table=True):
     __tablename__ = "user_events"
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -34,3 +63,7 @@ class UserEvent(SQLModel, table=True):
     article_id: Optional[str] = None
     ts: Optional[datetime] = None
     meta: Optional[Dict] = Field(default=None, sa_column=Column(JSON))
+
+# 기분 스냅샷(user_id + mood/stress_delta + ts 범위)용 부분 인덱스는 `python -m app.db.migrate` 에서 적용
+# meta.delta 가 문자열일 때 숫자로 인정하는 형식 (user_events.delta 생성식/스냅샷 폴백 공용)
+DELTA_NUMERIC_RE = "^-?[0-9]+([.][0-9]+)?$"
@@ -1,4 +1,6 @@
 # app/api/news/router.py
+import asyncio
+import importlib.util
 from typing import Optional, Dict, Any, List, Literal, Tuple
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -13,12 +15,29 @@ from .schemas import (
     ArticleCloseRequest,
     EventsIngestRequest,
     MoodEventRequest,
+    MoodEventsBulkRequest,
 )
 
 from . import service
 
 router = APIRouter(prefix="/news", tags=["news"])
 
+# ------------------------------
+# 외부 추천 API용 공유 클라이언트
+#  - 요청마다 새로 만들지 않고 keep-alive 커넥션 풀을 재사용
+#  - h2 패키지가 있으면 HTTP/2로 동시 요청을 한 소켓에 다중화
+# ------------------------------
+RECO_CLIENT = httpx.AsyncClient(
+    http2=importlib.util.find_spec("h2") is not None,
+    timeout=getattr(settings, "RECO_API_TIMEOUT", 5.0),
+    limits=httpx.Limits(max_keepalive_connections=50, keepalive_expiry=30),
+)
+
+
+async def close_reco_client() -> None:
+    await RECO_CLIENT.aclose()
+
+
 # ------------------------------
 # 내부 유틸: 외부 추천 API 호출(팀원 서버)
 #  - 에러가 나면 빈 결과로 폴백(절대 예외를 밖으로 던지지 않음)
@@ -34,12 +53,9 @@ async def _fetch_recommendations(
     params = {"similar_limit": similar_limit, "related_limit": related_limit}
 
     try:
-        async with httpx.AsyncClient(
-            timeout=getattr(settings, "RECO_API_TIMEOUT", 5.0)
-        ) as client:
-            r = await client.get(url, params=params)
-            r.raise_for_status()
-            return r.json()
+        r = await RECO_CLIENT.get(url, params=params)
+        r.raise_for_status()
+        return r.json()
     except Exception:
         # 타임아웃/HTTP 오류/네트워크 오류 모두 폴백
         return {"similar_articles": [], "related_topics": []}
@@ -48,6 +64,32 @@ async def _fetch_recommendations(
 # ------------------------------
 # 추천 아이템에 태도 필드 주입 (중첩 구조까지 안전 처리)
 # ------------------------------
+# 아이템 배열이 들어있을 수 있는 키 (앞쪽이 우선)
+_ARRAY_KEYS = ("recommendations", "related_topics", "similar_articles", "articles", "items")
+# 동일 키로 한 번 더 감싸져 오는 키
+_NESTED_KEYS = ("recommendations", "related_topics")
+
+
+def _locate_array(container) -> Tuple[Optional[dict], Optional[str], Optional[list]]:
+    if isinstance(container, list):
+        return None, None, container
+    if not isinstance(container, dict):
+        return None, None, None
+
+    # 1차 키 바로 배열
+    key = next((k for k in _ARRAY_KEYS if isinstance(container.get(k), list)), None)
+    if key is not None:
+        return container, key, container[key]
+
+    # 2차 키(동일 키 중첩)
+    for key in _NESTED_KEYS:
+        val = container.get(key)
+        if isinstance(val, dict) and isinstance(val.get(key), list):
+            return val, key, val[key]
+
+    return None, None, None
+
+
 async def _attach_attitudes_per_item(db: AsyncSession, items: Any) -> Any:
     """
     items가 다음과 같은 다양한 형태를 모두 지원:
@@ -58,70 +100,42 @@ async def _attach_attitudes_per_item(db: AsyncSession, items: Any) -> Any:
       - {"related_topics": {"related_topics": [ ... ]}}
       - 레거시: {"similar_articles": [ ... ]}, {"articles": [ ... ]}, {"items": [ ... ]}
     내부 배열의 각 원소에 DB에서 가져온 attitude/attitude_confidence를 주입.
+    (dict 원소는 복사하지 않고 그 자리에서 갱신)
     """
-    def locate_array(container) -> Tuple[Optional[dict], Optional[str], Optional[list]]:
-        if isinstance(container, list):
-            return None, None, container
-        if not isinstance(container, dict):
-            return None, None, None
-
-        # 1차 키 바로 배열
-        for key in ("recommendations", "related_topics", "similar_articles", "articles", "items"):
-            val = container.get(key)
-            if isinstance(val, list):
-                return container, key, val
-
-        # 2차 키(동일 키 중첩)
-        for key in ("recommendations", "related_topics"):
-            val = container.get(key)
-            if isinstance(val, dict):
-                inner = val.get(key)
-                if isinstance(inner, list):
-                    return val, key, inner
-
-        return None, None, None
-
     if items is None:
         return items
 
-    parent, key, arr = locate_array(items)
+    parent, key, arr = _locate_array(items)
     if arr is None:
         # 배열이 아니라면 그대로 반환
         return items
 
-    # 요소 정규화 + ID 수집
-    normalized: List[Dict[str, Any]] = []
-    ids: List[str] = []
+    # 요소 정규화 + ID 수집 (한 번에)
+    normalized: List[Tuple[Dict[str, Any], Optional[str]]] = []
     for it in arr:
-        obj = {"article_id": it} if isinstance(it, str) else dict(it)
+        obj = {"article_id": it} if isinstance(it, str) else it
         aid = obj.get("article_id") or obj.get("id")
-        if isinstance(aid, str):
-            ids.append(aid)
-        normalized.append(obj)
-
-    # DB 조회로 태도 맵 구성
-    attitude_map: Dict[str, Tuple[Optional[str], Optional[int]]] = {}
-    for aid in ids:
-        try:
-            art = await service.get_article(db, aid)
-            if art:
-                attitude_map[aid] = (art.get("attitude"), art.get("attitude_confidence"))
-        except Exception:
-            # 개별 실패는 무시
-            pass
+        normalized.append((obj, aid if isinstance(aid, str) else None))
+
+    # DB 조회로 태도 맵 구성 (IN 쿼리 1회)
+    try:
+        attitude_map = await service.get_attitudes_bulk(
+            db, [aid for _, aid in normalized if aid]
+        )
+    except Exception:
+        # 조회 실패 시 태도 없이 원형 유지
+        attitude_map = {}
 
     # 주입
-    for obj in normalized:
-        aid = obj.get("article_id") or obj.get("id")
-        if aid and aid in attitude_map:
-            att, conf = attitude_map[aid]
-            obj["attitude"] = att
-            obj["attitude_confidence"] = conf
+    for obj, aid in normalized:
+        if aid in attitude_map:
+            obj["attitude"], obj["attitude_confidence"] = attitude_map[aid]
 
     # 원 위치에 되돌려 넣기
+    objs = [obj for obj, _ in normalized]
     if parent is None:
-        return normalized  # 루트가 리스트였던 경우
-    parent[key] = normalized
+        return objs  # 루트가 리스트였던 경우
+    parent[key] = objs
     return items
 
 
@@ -172,16 +186,18 @@ async def get_news_complete(
     related_limit: int = Query(6, ge=1, le=20),
     db: AsyncSession = Depends(get_session),
 ):
-    # 1) 상세
-    try:
-        item = await service.get_article(db, article_id)
-    except Exception as e:
-        raise HTTPException(500, f"failed to load article: {e}")
+    # 1) 상세 + 2) 추천을 동시에 (추천은 에러가 나도 빈 값으로 폴백)
+    item, reco = await asyncio.gather(
+        service.get_article(db, article_id),
+        _fetch_recommendations(article_id, similar_limit, related_limit),
+        return_exceptions=True,
+    )
+    if isinstance(item, Exception):
+        raise HTTPException(500, f"failed to load article: {item}")
     if not item:
         raise HTTPException(404, "article not found")
-
-    # 2) 추천 (에러가 나도 빈 값으로 폴백)
-    reco = await _fetch_recommendations(article_id, similar_limit, related_limit)
+    if isinstance(reco, Exception):
+        reco = {"similar_articles": [], "related_topics": []}
 
     # 외부 응답의 다양한 키 지원 (유연 매핑)
     raw_similar = reco.get("similar") or reco.get("similar_articles") or {}
@@ -280,10 +296,11 @@ async def user_reads_today(
     user_id: str,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    with_total: bool = Query(False, description="true면 전체 건수(total)도 계산"),
     db: AsyncSession = Depends(get_session),
 ):
     return await service.list_user_reads_today(
-        db, user_id, limit=limit, offset=offset
+        db, user_id, limit=limit, offset=offset, with_total=with_total
     )
 
 
@@ -328,6 +345,19 @@ async def user_hourly_activity(
     return await service.get_user_hourly_activity(db, user_id, days=days, mode=mode)
 
 
+@router.get(
+    "/user/{user_id}/dashboard",
+    summary="사용자 대시보드 요약",
+    description="오늘 요약 + 최근 N일 분야별 통계(reads) + 시간대 히스토그램을 한 번에 반환합니다.",
+)
+async def user_dashboard(
+    user_id: str,
+    days: int = Query(7, ge=1, le=30),
+    db: AsyncSession = Depends(get_session),
+):
+    return await service.get_user_dashboard(db, user_id, days=days)
+
+
 # ------------------------------
 # Home Feed
 # ------------------------------
@@ -361,6 +391,16 @@ async def mood_event(body: MoodEventRequest, db: AsyncSession = Depends(get_sess
     return {"inserted": inserted_id}
 
 
+@router.post("/mood/events", status_code=status.HTTP_201_CREATED, summary="스트레스 이벤트 일괄 기록")
+async def mood_events(body: MoodEventsBulkRequest, db: AsyncSession = Depends(get_session)):
+    payloads: List[Dict[str, Any]] = [
+        (e.model_dump() if hasattr(e, "model_dump") else e.dict())
+        for e in body.events
+    ]
+    inserted_ids = await service.record_mood_events_bulk(db, payloads)
+    return {"inserted": inserted_ids}
+
+
 @router.get(
     "/mood/user/{user_id}/snapshot",
     summary="사용자 스트레스 스냅샷(오늘 점수/최근 N일/주간패턴)",
@@ -91,4 +91,8 @@ class MoodEventRequest(BaseModel):
     reason: str                   # 'read' | 'cleanseOn' 등
     attitude: Optional[str] = None  # '우호적'|'중립적'|'비판적' 등 (있으면)
     article_id: Optional[str] = None
-    ts: Optional[datetime] = None  # 없으면 서버 now()
\ No newline at end of file
+    ts: Optional[datetime] = None  # 없으면 서버 now()
+
+
+class MoodEventsBulkRequest(BaseModel):
+    events: List[MoodEventRequest]
\ No newline at end of file
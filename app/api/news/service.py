@@ -1,24 +1,41 @@
 # app/api/news/service.py
 import os
+import copy
 import hashlib
 import json
 import html
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Tuple
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone
+from zoneinfo import ZoneInfo
 from sqlalchemy.dialects.postgresql import JSONB
 import httpx
-from sqlalchemy import select, desc, and_, func, text, case, cast, Integer
+from sqlalchemy import select, insert, update, desc, and_, func, text, case, cast, Integer, bindparam, literal_column, TextClause
 from sqlalchemy.ext.asyncio import AsyncSession
-from dotenv import load_dotenv
 from sqlalchemy.types import Numeric
-load_dotenv()
+
+from app.config import load_env
+
+try:  # orjson이 있으면 더 빠른 디코더 사용 (선택 의존성)
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+load_env()
 
 FEED_LOOKBACK_DAYS = int(os.getenv("FEED_LOOKBACK_DAYS", "60"))
 BASELINE_STRESS = 50
 
-from .models import Article, ArticleRead, UserEvent
+from .models import Article, ArticleRead, UserEvent, DELTA_NUMERIC_RE
 
 KST = "Asia/Seoul"
+KST_TZ = ZoneInfo(KST)
 
 def _to_kst(col):
     """
@@ -30,10 +47,6 @@ def _to_kst(col):
     """
     return col.op("AT TIME ZONE")("UTC").op("AT TIME ZONE")(KST)
 
-def _now_kst():
-    # now()는 timestamptz → timezone(KST, now())는 KST 벽시계(naive) 반환
-    return func.timezone(KST, func.now())
-
 
 # ------------------------------------------------------------------------------ #
 # Config
@@ -42,6 +55,8 @@ HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "3.0"))
 SENTI_URL = os.getenv("SENTI_URL")
 CLEANSE_URL = os.getenv("CLEANSE_URL")
 RECO_URL = os.getenv("RECO_URL")
+HOME_FEED_CACHE_TTL = float(os.getenv("HOME_FEED_CACHE_TTL", "60"))
+HOME_FEED_CACHE_SIZE = int(os.getenv("HOME_FEED_CACHE_SIZE", "10000"))
 KST = "Asia/Seoul"
 
 DISPLAY_CATEGORIES = ["경제", "정치", "사회", "문화", "세계", "과학"]
@@ -85,13 +100,66 @@ def _read_row_to_dict(m) -> dict:
     }
 
 
-def _kst_today_window():
-    now_kst_local = func.timezone(KST, func.now())
-    start_kst_local = func.date_trunc("day", now_kst_local)
-    end_kst_local = start_kst_local + text("interval '1 day'")
-    return start_kst_local, end_kst_local
+def _utc_now() -> datetime:
+    # DB 컬럼과 동일한 naive UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _kst_midnight_utc(d: date) -> datetime:
+    """KST 날짜 d의 00:00을 naive UTC로"""
+    return (
+        datetime.combine(d, datetime.min.time(), tzinfo=KST_TZ)
+        .astimezone(timezone.utc)
+        .replace(tzinfo=None)
+    )
+
+
+def _kst_today_window() -> Tuple[datetime, datetime]:
+    """
+    오늘(KST) 00:00 ~ 내일 00:00 구간을 naive UTC 파라미터로 반환.
+    opened_at(naive UTC)과 바로 비교하므로 인덱스 범위 조건으로 쓸 수 있음.
+    """
+    today = datetime.now(KST_TZ).date()
+    return _kst_midnight_utc(today), _kst_midnight_utc(today + timedelta(days=1))
+
+
+def _kst_week_window() -> Tuple[datetime, datetime]:
+    """이번 주(KST, 월요일 시작 = date_trunc('week')) 구간을 naive UTC로 반환."""
+    today = datetime.now(KST_TZ).date()
+    monday = today - timedelta(days=today.weekday())
+    return _kst_midnight_utc(monday), _kst_midnight_utc(monday + timedelta(days=7))
+
+
+class _TTLCache:
+    """프로세스 내 LRU + TTL 캐시 (이벤트 루프 단일 스레드에서만 사용)"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key) -> Any:
+        hit = self._data.get(key)
+        if hit is None:
+            return None
+        expires, value = hit
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
 
+    def pop(self, key) -> None:
+        self._data.pop(key, None)
 
+
+@lru_cache(maxsize=65536)
 def _daily_seed(user_id: int, d: date) -> str:
     return hashlib.sha1(f"{user_id}:{d.isoformat()}".encode()).hexdigest()[:8]
 
@@ -103,114 +171,237 @@ def _as_list(v) -> List[str]:
     if isinstance(v, list):
         return v
     s = str(v).strip()
-    if not s:
+    # 배열/객체 리터럴이 아니면 파싱 시도 없이 종료
+    if not s or s[0] not in "[{":
         return []
     try:
-        return json.loads(s)
-    except Exception:
+        return _json_loads(s)
+    except ValueError:
+        # 작은따옴표로 직렬화된 경우 1회만 보정
         try:
-            return json.loads(s.replace("'", '"'))
-        except Exception:
+            return _json_loads(s.replace("'", '"'))
+        except ValueError:
             return []
 
 
+# Postgres 배열 리터럴 원소: "따옴표(\\ 이스케이프)" 또는 쉼표 전까지의 값
+_PG_ARRAY_ITEM = re.compile(r'"((?:[^"\\]|\\.)*)"|([^,]+)')
+_PG_ARRAY_ESCAPE = re.compile(r'\\(.)')
+
+
+def _parse_pg_text_array(inner: str) -> List[str]:
+    """'{a,"b, c"}'의 중괄호 안쪽 문자열 → ['a', 'b, c']"""
+    items: List[str] = []
+    for quoted, bare in _PG_ARRAY_ITEM.findall(inner):
+        v = _PG_ARRAY_ESCAPE.sub(r"\1", quoted) if quoted else bare
+        v = v.strip()
+        if v:
+            items.append(v)
+    return items
+
+
 def _build_highlight_html(content: str, evidences: List[str]) -> Optional[str]:
     """원문에서 evidence 문장을 찾아 하이라이트 HTML 생성."""
     if not content or not evidences:
         return None
 
     txt = content
-    # 긴 문장부터 매칭하면 겹침이 줄어듦
-    evs = sorted(set([e for e in evidences if e]), key=len, reverse=True)
-    ranges: List[tuple[int, int]] = []
-
-    def overlaps(a, b):
-        return not (a[1] <= b[0] or b[1] <= a[0])
-
-    for ev in evs:
-        start = 0
-        while True:
-            i = txt.find(ev, start)
-            if i == -1:
-                break
-            j = i + len(ev)
-            if any(overlaps((i, j), r) for r in ranges):
-                start = i + 1
-                continue
-            ranges.append((i, j))
-            start = j
-
-    if not ranges:
+    # 긴 문장을 앞에 둔 alternation 한 번으로 본문을 1패스 스캔
+    #  → 왼쪽부터 겹치지 않는 매치만 반환(같은 위치면 긴 문장 우선)
+    evs = sorted({e for e in evidences if e}, key=len, reverse=True)
+    if not evs:
         return None
+    pattern = re.compile("|".join(map(re.escape, evs)))
 
-    ranges.sort()
     out: List[str] = []
     cur = 0
-    for s, e in ranges:
+    for m in pattern.finditer(txt):
+        s, e = m.span()
         if cur < s:
             out.append(html.escape(txt[cur:s]))
         out.append(f'<mark class="nc-negative">{html.escape(txt[s:e])}</mark>')
         cur = e
+
+    if not out:
+        return None
     if cur < len(txt):
         out.append(html.escape(txt[cur:]))
 
     return "".join(out)
 
-# sentiment_articles의 선택 컬럼 프로빙(요약/하이라이트/근거문장)
-_SENTI_COLS_CHECKED = False
-_HAS_SUMMARY_HTML = False
-_HAS_HIGHLIGHT_HTML = False
-_HAS_EVIDENCE = False
-
-async def _probe_sentiment_optional_columns(session: AsyncSession) -> None:
-    """sentiment_articles에 선택 컬럼이 존재하는지 1회만 점검"""
-    global _SENTI_COLS_CHECKED, _HAS_SUMMARY_HTML, _HAS_HIGHLIGHT_HTML, _HAS_EVIDENCE
-    if _SENTI_COLS_CHECKED:
-        return
+# 스키마 선택 컬럼 프로빙 결과
+#  (sentiment_articles 요약/하이라이트/근거문장, original_article.label, user_events.delta)
+@dataclass(frozen=True)
+class SentiCaps:
+    has_summary_html: bool = False
+    has_highlight_html: bool = False
+    has_evidence: bool = False
+    has_article_label: bool = False
+    has_event_delta: bool = False
+
+
+_SENTI_CAPS: Optional[SentiCaps] = None
+
+async def load_senti_caps(session: AsyncSession) -> SentiCaps:
+    """선택 컬럼 존재 여부를 쿼리 1회로 점검해 저장 (앱 시작 시 1회 호출)"""
+    global _SENTI_CAPS
     sql = text("""
-        SELECT column_name
+        SELECT table_name, column_name
         FROM information_schema.columns
-        WHERE table_name = 'sentiment_articles'
-          AND column_name IN ('summary_html','highlight_html','evidence_sentences')
+        WHERE (table_name = 'sentiment_articles'
+               AND column_name IN ('summary_html','highlight_html','evidence_sentences'))
+           OR (table_name = 'original_article' AND column_name = 'label')
+           OR (table_name = 'user_events' AND column_name = 'delta')
     """)
-    rows = (await session.execute(sql)).all()
-    names = {r[0] for r in rows}
-    _HAS_SUMMARY_HTML   = 'summary_html' in names
-    _HAS_HIGHLIGHT_HTML = 'highlight_html' in names
-    _HAS_EVIDENCE       = 'evidence_sentences' in names
-    _SENTI_COLS_CHECKED = True
+    names = {(r[0], r[1]) for r in (await session.execute(sql)).all()}
+    _SENTI_CAPS = SentiCaps(
+        has_summary_html=("sentiment_articles", "summary_html") in names,
+        has_highlight_html=("sentiment_articles", "highlight_html") in names,
+        has_evidence=("sentiment_articles", "evidence_sentences") in names,
+        has_article_label=("original_article", "label") in names,
+        has_event_delta=("user_events", "delta") in names,
+    )
+    return _SENTI_CAPS
+
+async def _get_senti_caps(session: AsyncSession) -> SentiCaps:
+    # 시작 시 점검이 실패한 경우에만 첫 요청에서 점검
+    if _SENTI_CAPS is not None:
+        return _SENTI_CAPS
+    return await load_senti_caps(session)
+
+
+# 기사 → 표시 카테고리 (label 생성 컬럼이 없을 때의 폴백, ARTICLE_LABEL_DDL과 동일 규칙)
+#  - 접두어는 ILIKE 6번 대신 left(id,3) 한 번 계산 후 단순 CASE로 비교
+ARTICLE_LABEL_CASE_SQL = """
+    CASE lower(left(a.id, 3))
+      WHEN 'eco' THEN '경제'
+      WHEN 'pol' THEN '정치'
+      WHEN 'soc' THEN '사회'
+      WHEN 'lif' THEN '문화'
+      WHEN 'sci' THEN '과학'
+      WHEN 'int' THEN '세계'
+      ELSE CASE
+        WHEN a.category IN ('문화','생활/문화') THEN '문화'
+        WHEN a.category IN ('과학','IT/과학','IT') THEN '과학'
+        WHEN a.category IN ('국제','세계') THEN '세계'
+        ELSE COALESCE(a.category,'기타')
+      END
+    END
+"""
 
+# 읽음 기록의 기사 ID 접두어 → 표시 카테고리 (기사 행이 없어도 판정 가능)
+READ_PREFIX_LABEL_SQL = """
+      CASE lower(left(r.article_id, 3))
+        WHEN 'eco' THEN '경제'
+        WHEN 'pol' THEN '정치'
+        WHEN 'soc' THEN '사회'
+        WHEN 'lif' THEN '문화'
+        WHEN 'sci' THEN '과학'
+        WHEN 'int' THEN '세계'
+      END
+"""
 
-# ------------------------------------------------------------------------------ #
-# Article list / search  (★ 감정 조인 포함)
-# ------------------------------------------------------------------------------ #
-ATTITUDE_CASE_SQL = """
+# 읽음 기록 → 표시 카테고리 (표시 카테고리가 아니면 NULL)
+READ_LABEL_CASE_SQL = f"""
     COALESCE(
+      {READ_PREFIX_LABEL_SQL},
       CASE
-        WHEN sa.sentiment_classification IS NULL THEN NULL
-        -- 우호적
-        WHEN LOWER(TRIM(sa.sentiment_classification)) IN ('우호', '우호적', '긍정', '긍정적', 'positive', 'pos')
-          OR LOWER(TRIM(sa.sentiment_classification)) LIKE 'pos%%'
-          OR LOWER(TRIM(sa.sentiment_classification)) LIKE '긍정%%'
-          OR LOWER(TRIM(sa.sentiment_classification)) LIKE '우호%%'
-        THEN '우호적'
-        -- 비판적
-        WHEN LOWER(TRIM(sa.sentiment_classification)) IN ('비판', '비판적', '부정', '부정적', 'negative', 'neg')
-          OR LOWER(TRIM(sa.sentiment_classification)) LIKE 'neg%%'
-          OR LOWER(TRIM(sa.sentiment_classification)) LIKE '부정%%'
-          OR LOWER(TRIM(sa.sentiment_classification)) LIKE '비판%%'
-        THEN '비판적'
-        -- 중립적
-        WHEN LOWER(TRIM(sa.sentiment_classification)) IN ('중립', '중립적', 'neutral', 'neu')
-          OR LOWER(TRIM(sa.sentiment_classification)) LIKE 'neu%%'
-          OR LOWER(TRIM(sa.sentiment_classification)) LIKE '중립%%'
-        THEN '중립적'
+        WHEN a.category IN ('문화','생활/문화') THEN '문화'
+        WHEN a.category IN ('과학','IT/과학','IT') THEN '과학'
+        WHEN a.category IN ('국제','세계') THEN '세계'
+        WHEN a.category = '경제' THEN '경제'
+        WHEN a.category = '정치' THEN '정치'
+        WHEN a.category = '사회' THEN '사회'
         ELSE NULL
-      END,
-      '중립적'
+      END
     )
 """
 
+
+# ------------------------------------------------------------------------------ #
+# Article list / search  (★ 감정 조인 포함)
+# ------------------------------------------------------------------------------ #
+# sentiment_classification → 우호적/비판적/중립적 (SQL이 아니라 Python에서 판정)
+#  - 접두어로만 판정(pos*/긍정*/우호* → 우호적, neg*/부정*/비판* → 비판적)
+#  - 그 밖의 값/NULL은 모두 중립적
+#  - 원값 종류가 적으므로 lru_cache로 사실상 조회 테이블
+_ATTITUDE_PREFIXES = (
+    (("pos", "긍정", "우호"), "우호적"),
+    (("neg", "부정", "비판"), "비판적"),
+)
+
+
+@lru_cache(maxsize=256)
+def _classify_attitude(raw: Optional[str]) -> str:
+    if raw:
+        key = raw.strip().lower()
+        for prefixes, label in _ATTITUDE_PREFIXES:
+            if key.startswith(prefixes):
+                return label
+    return "중립적"
+
+# 기사당 감정 행 1개만 조인 (sentiment_articles.original_article_id 는 유니크가 아님)
+#  - 중복 행이 목록 항목/총계를 부풀리지 않도록 신뢰도가 가장 높은 1건만 사용
+#  - ix_sentiment_articles_original_article(INCLUDE classification, confidence)로 처리
+#  - 목록/단건/피드가 같은 행을 고르도록 정렬 규칙은 하나로 유지 (단건은 근거문장만 추가)
+_SENTI_ONE_JOIN_TMPL = """
+    LEFT JOIN LATERAL (
+        SELECT s.sentiment_classification, s.confidence{extra}
+        FROM sentiment_articles s
+        WHERE s.original_article_id = a.id
+        ORDER BY s.confidence DESC NULLS LAST, s.sentiment_classification
+        LIMIT 1
+    ) sa ON TRUE
+"""
+SENTI_ONE_JOIN_SQL = _SENTI_ONE_JOIN_TMPL.format(extra="")
+SENTI_ONE_DETAIL_JOIN_SQL = _SENTI_ONE_JOIN_TMPL.format(extra=", s.evidence_sentences")
+
+@lru_cache(maxsize=8)
+def _list_articles_sql(
+    has_category: bool, has_press: bool, has_q: bool
+) -> Tuple[TextClause, TextClause]:
+    """필터 조합(최대 8가지)별 목록/카운트 SQL을 1회만 만들어 재사용"""
+    conds = ["1=1"]
+    if has_category:
+        conds.append("a.category = :category")
+    if has_press:
+        conds.append("a.press = :press")
+    if has_q:
+        conds.append("(a.title ILIKE :like OR a.content ILIKE :like OR a.keywords ILIKE :like)")
+    where = " AND ".join(conds)
+
+    # 페이지를 먼저 자른 뒤(인덱스 정렬 + LIMIT) 반환할 행에만 감정 조인
+    sql = text(f"""
+        WITH page AS (
+            SELECT
+                a.id, a.url, a.category, a.published_at, a.title,
+                a.content, a.thumbnail_url, a.reporter, a.press,
+                a.keywords, a.scraped_at,
+                COUNT(*) OVER () AS total
+            FROM original_article a
+            WHERE {where}
+            ORDER BY a.published_at DESC NULLS LAST, a.id DESC
+            OFFSET :offset
+            LIMIT :limit
+        )
+        SELECT
+            a.id, a.url, a.category, a.published_at, a.title,
+            a.content, a.thumbnail_url, a.reporter, a.press,
+            a.keywords, a.scraped_at,
+            sa.sentiment_classification AS raw_attitude,
+            sa.confidence   AS attitude_confidence,
+            a.total
+        FROM page a
+        {SENTI_ONE_JOIN_SQL}
+        ORDER BY a.published_at DESC NULLS LAST, a.id DESC
+    """)
+    total_sql = text(f"""
+        SELECT COUNT(*) AS cnt
+        FROM original_article a
+        WHERE {where}
+    """)
+    return sql, total_sql
+
 async def list_articles(
     session: AsyncSession,
     *,
@@ -220,58 +411,32 @@ async def list_articles(
     press: Optional[str] = None,
     q: Optional[str] = None,
 ) -> Tuple[List[Dict[str, Any]], int]:
-    conds = ["1=1"]
     params: Dict[str, Any] = {"limit": int(limit), "offset": int(offset)}
     if category:
-        conds.append("a.category = :category")
         params["category"] = category
     if press:
-        conds.append("a.press = :press")
         params["press"] = press
     if q:
-        conds.append("(a.title ILIKE :like OR a.content ILIKE :like OR a.keywords ILIKE :like)")
         params["like"] = f"%{q}%"
+    sql, total_sql = _list_articles_sql(bool(category), bool(press), bool(q))
 
-    sql = text(f"""
-        SELECT
-            a.id, a.url, a.category, a.published_at, a.title,
-            a.content, a.thumbnail_url, a.reporter, a.press,
-            a.keywords, a.scraped_at,
-            {ATTITUDE_CASE_SQL} AS attitude,
-            sa.confidence   AS attitude_confidence
-        FROM original_article a
-        LEFT JOIN sentiment_articles sa
-          ON sa.original_article_id = a.id
-        WHERE {' AND '.join(conds)}
-        ORDER BY a.published_at DESC NULLS LAST, a.id DESC
-        OFFSET :offset
-        LIMIT :limit
-    """)
-    rows = (await session.execute(sql, params)).mappings().all()
+    result = (await session.execute(sql, params)).mappings()
 
+    # 컬럼명이 응답 키와 같으므로 행을 그대로 dict로 바꾸고 감정/총계만 정리 (1회 순회)
     items: List[Dict[str, Any]] = []
-    for r in rows:
-        items.append({
-            "id": r["id"],
-            "url": r.get("url"),
-            "category": r.get("category"),
-            "published_at": r.get("published_at"),
-            "title": r.get("title"),
-            "content": r.get("content"),
-            "thumbnail_url": r.get("thumbnail_url"),
-            "reporter": r.get("reporter"),
-            "press": r.get("press"),
-            "keywords": r.get("keywords"),
-            "scraped_at": r.get("scraped_at"),
-            "attitude": r.get("attitude") or "중립적",
-            "attitude_confidence": r.get("attitude_confidence"),
-        })
-
-    total_sql = text(f"""
-        SELECT COUNT(*) AS cnt
-        FROM original_article a
-        WHERE {' AND '.join(conds)}
-    """)
+    total = 0
+    for r in result:
+        item = dict(r)
+        total = item.pop("total")
+        item["attitude"] = _classify_attitude(item.pop("raw_attitude"))
+        items.append(item)
+
+    if items:
+        return items, int(total)
+    if not offset:
+        return items, 0
+
+    # OFFSET이 범위를 넘어 행이 없으면 윈도우 카운트를 못 읽으므로 별도 집계
     total = (await session.execute(total_sql, params)).scalar_one()
     return items, int(total)
 
@@ -280,44 +445,19 @@ async def get_article(session: AsyncSession, article_id: str) -> Dict[str, Any]:
     """
     단건 조회 + sentiment_articles(감정/증거문장) + summarized_articles(요약) 조인.
     """
-    attitude_case = """
-        COALESCE(
-          CASE
-            WHEN sa.sentiment_classification IS NULL THEN NULL
-            WHEN LOWER(TRIM(sa.sentiment_classification)) IN ('우호','우호적','긍정','긍정적','positive','pos')
-              OR LOWER(TRIM(sa.sentiment_classification)) LIKE 'pos%%'
-              OR LOWER(TRIM(sa.sentiment_classification)) LIKE '긍정%%'
-              OR LOWER(TRIM(sa.sentiment_classification)) LIKE '우호%%'
-            THEN '우호적'
-            WHEN LOWER(TRIM(sa.sentiment_classification)) IN ('비판','비판적','부정','부정적','negative','neg')
-              OR LOWER(TRIM(sa.sentiment_classification)) LIKE 'neg%%'
-              OR LOWER(TRIM(sa.sentiment_classification)) LIKE '부정%%'
-              OR LOWER(TRIM(sa.sentiment_classification)) LIKE '비판%%'
-            THEN '비판적'
-            WHEN LOWER(TRIM(sa.sentiment_classification)) IN ('중립','중립적','neutral','neu')
-              OR LOWER(TRIM(sa.sentiment_classification)) LIKE 'neu%%'
-              OR LOWER(TRIM(sa.sentiment_classification)) LIKE '중립%%'
-            THEN '중립적'
-            ELSE NULL
-          END,
-          '중립적'
-        )
-    """
-
     sql = text(f"""
         SELECT
             a.id, a.url, a.category, a.published_at, a.title,
             a.content, a.thumbnail_url, a.reporter, a.press,
             a.keywords, a.scraped_at,
 
-            {attitude_case}  AS attitude,
+            sa.sentiment_classification AS raw_attitude,
             sa.confidence    AS attitude_confidence,
             sa.evidence_sentences AS evidence_sentences,
 
             sm.summary_content AS summary_json
         FROM original_article a
-        LEFT JOIN sentiment_articles sa
-          ON sa.original_article_id = a.id
+        {SENTI_ONE_DETAIL_JOIN_SQL}
         LEFT JOIN LATERAL (
             SELECT summary_content
             FROM summarized_articles s
@@ -340,24 +480,7 @@ async def get_article(session: AsyncSession, article_id: str) -> Dict[str, Any]:
     elif isinstance(ev, str):
         s = ev.strip()
         if s.startswith("{") and s.endswith("}"):
-            s = s[1:-1]
-            parts = []
-            buf = ""
-            in_quote = False
-            i = 0
-            while i < len(s):
-                ch = s[i]
-                if ch == '"':
-                    in_quote = not in_quote
-                elif ch == "," and not in_quote:
-                    parts.append(buf)
-                    buf = ""
-                else:
-                    buf += ch
-                i += 1
-            if buf:
-                parts.append(buf)
-            evidence_items = [p.replace('""', '"').strip().strip('"') for p in parts if p.strip().strip('"')]
+            evidence_items = _parse_pg_text_array(s[1:-1])
         else:
             if s:
                 evidence_items = [s]
@@ -367,7 +490,7 @@ async def get_article(session: AsyncSession, article_id: str) -> Dict[str, Any]:
     raw = row.get("summary_json")
     if raw:
         try:
-            obj = json.loads(raw) if isinstance(raw, str) else raw
+            obj = _json_loads(raw) if isinstance(raw, str) else raw
             if isinstance(obj, dict) and "summary" in obj:
                 val = obj["summary"]
             else:
@@ -391,12 +514,38 @@ async def get_article(session: AsyncSession, article_id: str) -> Dict[str, Any]:
         "press": row.get("press"),
         "keywords": row.get("keywords"),
         "scraped_at": row.get("scraped_at"),
-        "attitude": row.get("attitude"),
+        "attitude": _classify_attitude(row.get("raw_attitude")),
         "attitude_confidence": row.get("attitude_confidence"),
         "evidence_sentences": evidence_items,
         "summary_items": summary_items,
     }
 
+
+async def get_attitudes_bulk(
+    session: AsyncSession, ids: List[str]
+) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+    """
+    여러 기사 ID의 태도/신뢰도를 IN 쿼리 1회로 조회.
+    반환: {article_id: (attitude, attitude_confidence)} (없는 ID는 키 없음)
+    """
+    if not ids:
+        return {}
+
+    sql = text(f"""
+        SELECT
+            a.id,
+            sa.sentiment_classification AS raw_attitude,
+            sa.confidence   AS attitude_confidence
+        FROM original_article a
+        {SENTI_ONE_JOIN_SQL}
+        WHERE a.id IN :ids
+    """).bindparams(bindparam("ids", expanding=True))
+    rows = (await session.execute(sql, {"ids": list(dict.fromkeys(ids))})).mappings().all()
+    return {
+        r["id"]: (_classify_attitude(r["raw_attitude"]), r["attitude_confidence"])
+        for r in rows
+    }
+
 # ------------------------------------------------------------------------------ #
 # Bundle (article + optional sentiment/cleanse/reco)
 # ------------------------------------------------------------------------------ #
@@ -492,9 +641,9 @@ async def bundle_article(
 async def open_read(session: AsyncSession, article_id: str, user_id: str) -> str:
     now = datetime.utcnow()
 
-    existing = (
+    existing_id = (
         await session.execute(
-            select(ArticleRead)
+            select(ArticleRead.id)
             .where(
                 and_(
                     ArticleRead.user_id == int(user_id),
@@ -505,18 +654,17 @@ async def open_read(session: AsyncSession, article_id: str, user_id: str) -> str
             .order_by(desc(ArticleRead.opened_at))
             .limit(1)
         )
-    ).scalar_one_or_none()
-    if existing:
-        return str(existing.id)
-
-    row = ArticleRead(
-        user_id=int(user_id),
-        article_id=article_id,
-        opened_at=now,
-    )
-    session.add(row)
-    await session.flush()
-    read_id = row.id
+    ).scalar()
+    if existing_id is not None:
+        return str(existing_id)
+
+    read_id = (
+        await session.execute(
+            insert(ArticleRead)
+            .values(user_id=int(user_id), article_id=article_id, opened_at=now, dwell_seconds=0)
+            .returning(ArticleRead.id)
+        )
+    ).scalar_one()
 
     session.add(
         UserEvent(
@@ -528,41 +676,44 @@ async def open_read(session: AsyncSession, article_id: str, user_id: str) -> str
         )
     )
     await session.commit()
+    _invalidate_home_feed(int(user_id))
     return str(read_id)
 
 
 async def close_read(
     session: AsyncSession, article_id: str, user_id: str, read_id: str
 ) -> int:
-    row = (
-        await session.execute(
-            select(ArticleRead).where(
-                ArticleRead.id == int(read_id),
-                ArticleRead.user_id == int(user_id),
-                ArticleRead.article_id == article_id,
-            )
+    now = datetime.utcnow()
+    # 체류 시간은 DB에서 계산하고 UPDATE ... RETURNING으로 한 번에 받아옴
+    elapsed = func.extract("epoch", now - func.coalesce(ArticleRead.opened_at, now))
+    stmt = (
+        update(ArticleRead)
+        .where(
+            ArticleRead.id == int(read_id),
+            ArticleRead.user_id == int(user_id),
+            ArticleRead.article_id == article_id,
         )
-    ).scalar_one_or_none()
-    if not row:
+        .values(
+            closed_at=now,
+            dwell_seconds=func.greatest(0, cast(func.floor(elapsed), Integer)),
+        )
+        .returning(ArticleRead.dwell_seconds)
+    )
+    dwell = (await session.execute(stmt)).scalar()
+    if dwell is None:
         return -1
 
-    now = datetime.utcnow()
-    opened_at = row.opened_at or now
-
-    row.closed_at = now
-    row.dwell_seconds = max(0, int((now - opened_at).total_seconds()))
-
-    session.add(
-        UserEvent(
+    await session.execute(
+        insert(UserEvent).values(
             user_id=int(user_id),
             event_type="article_close",
             article_id=article_id,
-            meta={"dwell_seconds": row.dwell_seconds},
+            meta={"dwell_seconds": dwell},
             ts=now,
         )
     )
     await session.commit()
-    return row.dwell_seconds
+    return dwell
 
 
 # ------------------------------------------------------------------------------ #
@@ -570,27 +721,28 @@ async def close_read(
 # ------------------------------------------------------------------------------ #
 async def ingest_events(session: AsyncSession, items: List[Dict[str, Any]]) -> int:
     now = datetime.utcnow()
-    objs: List[UserEvent] = []
+    rows: List[Dict[str, Any]] = []
 
     for e in items:
         try:
             uid = int(e.get("user_id"))
         except Exception:
             continue
-        objs.append(
-            UserEvent(
-                user_id=uid,
-                event_type=str(e.get("event_type")),
-                article_id=e.get("article_id"),
-                meta=e.get("metadata") or e.get("meta") or {},
-                ts=e.get("ts") or now,
-            )
+        rows.append(
+            {
+                "user_id": uid,
+                "event_type": str(e.get("event_type")),
+                "article_id": e.get("article_id"),
+                "meta": e.get("metadata") or e.get("meta") or {},
+                "ts": e.get("ts") or now,
+            }
         )
 
-    if objs:
-        session.add_all(objs)
+    if rows:
+        # ORM unit-of-work 대신 Core executemany 한 번으로 일괄 INSERT
+        await session.execute(insert(UserEvent), rows)
         await session.commit()
-    return len(objs)
+    return len(rows)
 
 
 # ------------------------------------------------------------------------------ #
@@ -613,110 +765,211 @@ async def get_article_stats(session: AsyncSession, article_id: str) -> dict:
 # ------------------------------------------------------------------------------ #
 # User today / week (KST)
 # ------------------------------------------------------------------------------ #
+# 오늘 요약 / 분야별 통계 / 시간대 히스토그램 공용 SQL
+#  - reads CTE: article_reads(user_id, opened_at) 범위 스캔 1회 (여러 파트가 참조해도 1회만 스캔)
+#  - 단건 API는 필요한 파트만, 대시보드는 세 파트를 한 번에 조회
+#  - opened_at 은 naive UTC → 시간대 계산은 (opened_at AT TIME ZONE 'UTC') AT TIME ZONE :tz
+_USER_STATS_PARTS = ("today", "fields", "hourly")
+
+
+@lru_cache(maxsize=32)
+def _user_stats_sql(
+    parts: Tuple[str, ...], *, has_until: bool, has_label: bool, metric: str
+) -> TextClause:
+    """파트 조합/윈도우 상한 유무/label 컬럼 유무/지표별로 1회만 만들어 재사용"""
+    until = "AND r.opened_at < :until" if has_until else ""
+    ctes = [f"""
+        reads AS (
+          SELECT r.article_id, r.opened_at, r.dwell_seconds
+          FROM article_reads r
+          WHERE r.user_id = :uid
+            AND r.opened_at >= :since
+            {until}
+        )"""]
+    cols = []
+    if "today" in parts:
+        ctes.append("""
+        today AS (
+          SELECT COUNT(*) AS reads, COALESCE(SUM(dwell_seconds), 0) AS total_dwell
+          FROM reads
+          WHERE opened_at >= :today_start AND opened_at < :today_end
+        )""")
+        cols += [
+            "(SELECT reads FROM today)       AS today_reads",
+            "(SELECT total_dwell FROM today) AS today_dwell",
+        ]
+    if "fields" in parts:
+        label_sql = "a.label" if has_label else ARTICLE_LABEL_CASE_SQL
+        value_sql = "COALESCE(SUM(r.dwell_seconds), 0)" if metric == "dwell" else "COUNT(*)"
+        ctes.append(f"""
+        fields AS (
+          SELECT COALESCE({label_sql}, '기타') AS label, {value_sql} AS value
+          FROM reads r
+          JOIN original_article a ON a.id = r.article_id
+          GROUP BY 1
+        )""")
+        cols.append("(SELECT COALESCE(jsonb_object_agg(label, value), '{}'::jsonb) FROM fields) AS fields")
+    if "hourly" in parts:
+        ctes.append("""
+        hourly AS (
+          SELECT EXTRACT(HOUR FROM ((opened_at AT TIME ZONE 'UTC') AT TIME ZONE :tz))::int AS hour,
+                 COUNT(*) AS cnt
+          FROM reads
+          GROUP BY 1
+        )""")
+        cols.append("(SELECT COALESCE(jsonb_object_agg(hour, cnt), '{}'::jsonb) FROM hourly) AS hourly")
+
+    return text("WITH" + ",".join(ctes) + "\nSELECT\n  " + ",\n  ".join(cols))
+
+
+async def _user_stats(
+    session: AsyncSession,
+    user_id: str,
+    parts: Tuple[str, ...],
+    *,
+    since: datetime,
+    until: Optional[datetime] = None,
+    metric: str = "reads",
+) -> Dict[str, Any]:
+    """[since, until) 구간 읽기 기록에서 요청한 파트만 집계. 반환: {today, fields, hourly} 중 요청한 키"""
+    caps = await _get_senti_caps(session) if "fields" in parts else None
+    sql = _user_stats_sql(
+        parts,
+        has_until=until is not None,
+        has_label=bool(caps and caps.has_article_label),
+        metric="dwell" if metric == "dwell" else "reads",
+    )
+    params: Dict[str, Any] = {"uid": int(user_id), "since": since}
+    if until is not None:
+        params["until"] = until
+    if "hourly" in parts:
+        params["tz"] = KST
+    if "today" in parts:
+        params["today_start"], params["today_end"] = _kst_today_window()
+
+    row = (await session.execute(sql, params)).mappings().one()
+
+    out: Dict[str, Any] = {}
+    if "today" in parts:
+        out["today"] = {"reads": int(row["today_reads"]), "total_dwell": int(row["today_dwell"])}
+    for key, cast_key in (("fields", str), ("hourly", int)):
+        if key in parts:
+            raw = row[key]
+            if isinstance(raw, str):
+                raw = _json_loads(raw)
+            out[key] = {cast_key(k): int(v) for k, v in (raw or {}).items()}
+    return out
+
+
 async def get_user_today(session: AsyncSession, user_id: str) -> dict:
     start_kst, end_kst = _kst_today_window()
-
-    q = select(
-        func.count().label("reads"),
-        func.coalesce(func.sum(ArticleRead.dwell_seconds), 0).label("total_dwell"),
-    ).where(
-        ArticleRead.user_id == int(user_id),
-        ArticleRead.opened_at >= start_kst,
-        ArticleRead.opened_at < end_kst,
-    )
-    r = (await session.execute(q)).one()
-    return {"reads": int(r.reads), "total_dwell": int(r.total_dwell)}
+    stats = await _user_stats(session, user_id, ("today",), since=start_kst, until=end_kst)
+    return stats["today"]
 
 
-async def list_user_reads_today(
-    session: AsyncSession, user_id: str, *, limit: int = 50, offset: int = 0
+async def _list_user_reads(
+    session: AsyncSession,
+    user_id: str,
+    start: datetime,
+    end: datetime,
+    *,
+    limit: int,
+    offset: int,
+    with_total: bool,
 ) -> dict:
-    start_kst, end_kst = _kst_today_window()
+    """
+    [start, end) 구간 읽기 기록 페이지 조회.
+    limit+1건을 가져와 has_more를 판단하고, 전체 건수는 with_total일 때만 윈도우 함수로 계산.
+    """
+    cond = and_(
+        ArticleRead.user_id == int(user_id),
+        ArticleRead.opened_at >= start,
+        ArticleRead.opened_at < end,
+    )
+    cols = [
+        ArticleRead.id.label("read_id"),
+        ArticleRead.opened_at,
+        ArticleRead.closed_at,
+        ArticleRead.dwell_seconds,
+        Article.id.label("article_id"),
+        Article.title,
+        Article.category,
+        Article.press,
+        Article.published_at,
+        Article.thumbnail_url,
+    ]
+    if with_total:
+        cols.append(func.count().over().label("total"))
 
-    base = (
-        select(
-            ArticleRead.id.label("read_id"),
-            ArticleRead.opened_at,
-            ArticleRead.closed_at,
-            ArticleRead.dwell_seconds,
-            Article.id.label("article_id"),
-            Article.title,
-            Article.category,
-            Article.press,
-            Article.published_at,
-            Article.thumbnail_url,
-        )
+    q = (
+        select(*cols)
         .join(Article, Article.id == ArticleRead.article_id)
-        .where(
-            ArticleRead.user_id == int(user_id),
-            ArticleRead.opened_at >= start_kst,
-            ArticleRead.opened_at < end_kst,
-        )
+        .where(cond)
         .order_by(desc(ArticleRead.opened_at))
+        .offset(offset)
+        .limit(limit + 1)
     )
-
-    rows = (await session.execute(base.offset(offset).limit(limit))).all()
+    rows = (await session.execute(q)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
     items = [_read_row_to_dict(r._mapping) for r in rows]
 
-    total = (
-        await session.execute(
-            select(func.count())
-            .select_from(ArticleRead)
-            .where(
-                ArticleRead.user_id == int(user_id),
-                ArticleRead.opened_at >= start_kst,
-                ArticleRead.opened_at < end_kst,
+    total: Optional[int] = None
+    if with_total:
+        if rows:
+            total = int(rows[0].total)
+        elif not offset:
+            total = 0
+        else:
+            # OFFSET이 범위를 넘어 행이 없을 때만 별도 집계
+            total = int(
+                (
+                    await session.execute(
+                        select(func.count())
+                        .select_from(ArticleRead)
+                        .join(Article, Article.id == ArticleRead.article_id)
+                        .where(cond)
+                    )
+                ).scalar_one()
             )
-        )
-    ).scalar_one()
 
-    return {"items": items, "limit": limit, "offset": offset, "total": int(total)}
+    return {
+        "items": items,
+        "limit": limit,
+        "offset": offset,
+        "has_more": has_more,
+        "total": total,
+    }
 
 
-async def list_user_reads_week(
-    session: AsyncSession, user_id: str, *, limit: int = 50, offset: int = 0
+async def list_user_reads_today(
+    session: AsyncSession,
+    user_id: str,
+    *,
+    limit: int = 50,
+    offset: int = 0,
+    with_total: bool = False,
 ) -> dict:
-    seoul_opened = func.timezone(KST, ArticleRead.opened_at)
-    seoul_now = func.timezone(KST, func.now())
-
-    base = (
-        select(
-            ArticleRead.id.label("read_id"),
-            ArticleRead.opened_at,
-            ArticleRead.closed_at,
-            ArticleRead.dwell_seconds,
-            Article.id.label("article_id"),
-            Article.title,
-            Article.category,
-            Article.press,
-            Article.published_at,
-            Article.thumbnail_url,
-        )
-        .join(Article, Article.id == ArticleRead.article_id)
-        .where(
-            ArticleRead.user_id == int(user_id),
-            func.date_trunc("week", seoul_opened)
-            == func.date_trunc("week", seoul_now),
-        )
-        .order_by(desc(ArticleRead.opened_at))
+    start_kst, end_kst = _kst_today_window()
+    return await _list_user_reads(
+        session, user_id, start_kst, end_kst,
+        limit=limit, offset=offset, with_total=with_total,
     )
 
-    rows = (await session.execute(base.offset(offset).limit(limit))).all()
-    items = [_read_row_to_dict(r._mapping) for r in rows]
 
-    total = (
-        await session.execute(
-            select(func.count())
-            .select_from(ArticleRead)
-            .where(
-                ArticleRead.user_id == int(user_id),
-                func.date_trunc("week", seoul_opened)
-                == func.date_trunc("week", seoul_now),
-            )
-        )
-    ).scalar_one()
-
-    return {"items": items, "limit": limit, "offset": offset, "total": int(total)}
+async def list_user_reads_week(
+    session: AsyncSession,
+    user_id: str,
+    *,
+    limit: int = 50,
+    offset: int = 0,
+    with_total: bool = False,
+) -> dict:
+    start_utc, end_utc = _kst_week_window()
+    return await _list_user_reads(
+        session, user_id, start_utc, end_utc,
+        limit=limit, offset=offset, with_total=with_total,
+    )
 
 
 # ------------------------------------------------------------------------------ #
@@ -730,65 +983,25 @@ async def get_user_field_stats(
     metric: str = "reads",
     mode: str = "rolling",
 ) -> Dict[str, Any]:
-    value_col = (
-        func.count().label("value")
-        if metric != "dwell"
-        else func.coalesce(func.sum(ArticleRead.dwell_seconds), 0).label("value")
-    )
-
-    cat_norm = case(
-        (Article.category.in_(["문화", "생활/문화"]), "문화"),
-        (Article.category.in_(["과학", "IT/과학", "IT"]), "과학"),
-        (Article.category.in_(["국제", "세계"]), "세계"),
-        (Article.category == "경제", "경제"),
-        (Article.category == "정치", "정치"),
-        (Article.category == "사회", "사회"),
-        else_=func.coalesce(Article.category, "기타"),
-    )
-
-    label_expr = case(
-        (Article.id.ilike("eco%"), "경제"),
-        (Article.id.ilike("pol%"), "정치"),
-        (Article.id.ilike("soc%"), "사회"),
-        (Article.id.ilike("lif%"), "문화"),
-        (Article.id.ilike("sci%"), "과학"),
-        (Article.id.ilike("int%"), "세계"),
-        else_=cat_norm,
-    ).label("label")
-
-    base = (
-        select(label_expr, value_col)
-        .select_from(ArticleRead)
-        .join(Article, Article.id == ArticleRead.article_id)
-        .where(ArticleRead.user_id == int(user_id))
-    )
-
-    # ✅ opened_at을 KST 벽시계로 변환
-    opened_kst = _to_kst(ArticleRead.opened_at)
-    now_kst = _now_kst()
-
+    # ✅ KST 기준 구간을 Python에서 naive UTC로 계산해 opened_at과 직접 비교
+    until: Optional[datetime] = None
     if mode == "day":
         # 오늘 00:00 ~ 내일 00:00 (KST)
-        start = func.date_trunc("day", now_kst)
-        end = start + text("interval '1 day'")
-        base = base.where(opened_kst >= start, opened_kst < end)
+        since, until = _kst_today_window()
     elif mode == "week":
-        base = base.where(
-            func.date_trunc("week", opened_kst) == func.date_trunc("week", now_kst)
-        )
+        since, until = _kst_week_window()
     else:  # rolling
-        base = base.where(
-            opened_kst >= (now_kst - text(f"interval '{int(days)} day'"))
-        )
+        since = _utc_now() - timedelta(days=int(days))
 
-    q = base.group_by(label_expr).order_by(desc("value"))
-    rows = (await session.execute(q)).all()
+    stats = await _user_stats(
+        session, user_id, ("fields",), since=since, until=until, metric=metric
+    )
+    return _field_stats_payload(stats["fields"], metric=metric, mode=mode, days=days)
 
-    counts: Dict[str, int] = {}
-    for r in rows:
-        label = (r.label or "기타")
-        counts[label] = int(r.value)
 
+def _field_stats_payload(
+    counts: Dict[str, int], *, metric: str, mode: str, days: int
+) -> Dict[str, Any]:
     stats = []
     for cat in DISPLAY_CATEGORIES:
         c = counts.get(cat, 0)
@@ -815,236 +1028,227 @@ async def get_user_hourly_activity(
     days: int = 7,
     mode: str = "rolling",
 ) -> Dict[str, Any]:
-    hour_expr = func.extract("hour", func.timezone(KST, ArticleRead.opened_at)).label("hour")
-
-    base = (
-        select(hour_expr, func.count().label("cnt"))
-        .select_from(ArticleRead)
-        .where(ArticleRead.user_id == int(user_id))
-    )
-
+    until: Optional[datetime] = None
     if mode == "week":
-        seoul_opened = func.timezone(KST, ArticleRead.opened_at)
-        seoul_now = func.timezone(KST, func.now())
-        base = base.where(
-            func.date_trunc("week", seoul_opened) == func.date_trunc("week", seoul_now)
-        )
+        since, until = _kst_week_window()
     else:
-        base = base.where(
-            ArticleRead.opened_at >= (func.now() - text(f"interval '{int(days)} days'"))
-        )
+        since = _utc_now() - timedelta(days=int(days))
+
+    stats = await _user_stats(session, user_id, ("hourly",), since=since, until=until)
+    return _hourly_payload(stats["hourly"])
 
-    q = base.group_by(hour_expr).order_by(hour_expr.asc())
-    rows = (await session.execute(q)).all()
 
-    m = {int(r.hour): int(r.cnt) for r in rows}
+def _hourly_payload(m: Dict[int, int]) -> Dict[str, Any]:
     bins = [{"hour": h, "count": m.get(h, 0)} for h in range(24)]
     total = sum(m.values())
     return {"bins": bins, "total": int(total)}
 
 
 # ------------------------------------------------------------------------------ #
-# Home Feed
+# Dashboard (today + field-stats + hourly 한 번에)
 # ------------------------------------------------------------------------------ #
-async def get_home_feed(
-    session: AsyncSession,
-    user_id: str,
-    *,
-    exclude_read: bool = True,
+async def get_user_dashboard(
+    session: AsyncSession, user_id: str, *, days: int = 7
 ) -> Dict[str, Any]:
-    uid = int(user_id)
-    seed = _daily_seed(uid, date.today())
-    days_back = FEED_LOOKBACK_DAYS
+    """
+    오늘 요약 / 분야별 통계(최근 N일, reads) / 시간대 히스토그램(최근 N일)을
+    article_reads(user_id, opened_at) 범위 스캔 1회로 집계.
+    (오늘 00:00 KST는 항상 최근 1일 안이므로 같은 범위에 포함됨)
+    """
+    days = max(1, int(days))
+    stats = await _user_stats(
+        session, user_id, _USER_STATS_PARTS, since=_utc_now() - timedelta(days=days)
+    )
+    return {
+        "today": stats["today"],
+        "field_stats": _field_stats_payload(
+            stats["fields"], metric="reads", mode="rolling", days=days
+        ),
+        "hourly": _hourly_payload(stats["hourly"]),
+    }
 
-    counts_sql = text("""
-    SELECT
-      COALESCE(
-        CASE
-          WHEN r.article_id ILIKE 'eco%%' THEN '경제'
-          WHEN r.article_id ILIKE 'pol%%' THEN '정치'
-          WHEN r.article_id ILIKE 'soc%%' THEN '사회'
-          WHEN r.article_id ILIKE 'lif%%' THEN '문화'
-          WHEN r.article_id ILIKE 'sci%%' THEN '과학'
-          WHEN r.article_id ILIKE 'int%%' THEN '세계'
-          ELSE NULL
-        END,
-        CASE
-          WHEN a.category IN ('문화','생활/문화') THEN '문화'
-          WHEN a.category IN ('과학','IT/과학','IT') THEN '과학'
-          WHEN a.category IN ('국제','세계') THEN '세계'
-          WHEN a.category = '경제' THEN '경제'
-          WHEN a.category = '정치' THEN '정치'
-          WHEN a.category = '사회' THEN '사회'
-          ELSE NULL
-        END
-      ) AS label,
-      COUNT(*) AS cnt
-    FROM article_reads r
-    LEFT JOIN original_article a ON a.id = r.article_id
-    WHERE r.user_id = :uid
-      AND r.opened_at >= (now() - interval '1 day')
-    GROUP BY label
-    """)
-    cnt_rows = (await session.execute(counts_sql, {"uid": uid})).all()
-    read_counts: Dict[str, int] = {row.label: int(row.cnt) for row in cnt_rows if row.label}
-    read_counts = {c: read_counts.get(c, 0) for c in DISPLAY_CATEGORIES}
 
-    limits: Dict[str, int] = {}
-    for c in DISPLAY_CATEGORIES:
-        rc = read_counts.get(c, 0)
-        limits[c] = 6 if rc >= 10 else (5 if rc >= 5 else 3)
-    max_limit = max(limits.values()) if limits else 6
+# ------------------------------------------------------------------------------ #
+# Home Feed
+# ------------------------------------------------------------------------------ #
+# 홈 피드 기사 항목으로 내보내는 컬럼
+_FEED_ITEM_COLS = (
+    "id", "title", "category", "press", "published_at", "thumbnail_url",
+    "attitude_confidence",
+)
+
 
-    date_clause = """
-      AND COALESCE(a.published_at, a.scraped_at)
-          >= CURRENT_DATE - (:days * interval '1 day')
+@lru_cache(maxsize=4)
+def _home_feed_sql(exclude_read: bool, has_label: bool) -> TextClause:
+    """
+    홈 피드 SQL은 (읽은 기사 제외 여부, label 컬럼 유무)에 따라서만 달라지므로
+    조합별로 1회만 만들어 재사용.
     """
     label_allow = "('경제','정치','사회','문화','세계','과학')"
-
-    exclude_clause = ""
-    if exclude_read:
-        exclude_clause = """
-        AND NOT EXISTS (
-            SELECT 1
-            FROM article_reads r
-            WHERE r.user_id = :uid
-              AND r.article_id = a.id
-              AND r.opened_at >= (now() - interval '1 day')
+    if has_label:
+        # 생성 컬럼 사용: 표시 카테고리 외 라벨은 집계에서 제외(NULL)
+        label_case = "a.label"
+        # 기사 행이 없는 읽음도 폴백(READ_LABEL_CASE_SQL)과 같이 ID 접두어로 판정
+        read_label = (
+            f"COALESCE(CASE WHEN a.label IN {label_allow} THEN a.label END, {READ_PREFIX_LABEL_SQL})"
         )
-        """
-
-    label_case = """
-        CASE
-          WHEN a.id ILIKE 'eco%' THEN '경제'
-          WHEN a.id ILIKE 'pol%' THEN '정치'
-          WHEN a.id ILIKE 'soc%' THEN '사회'
-          WHEN a.id ILIKE 'lif%' THEN '문화'
-          WHEN a.id ILIKE 'sci%' THEN '과학'
-          WHEN a.id ILIKE 'int%' THEN '세계'
-          WHEN a.category IN ('문화','생활/문화') THEN '문화'
-          WHEN a.category IN ('과학','IT/과학','IT') THEN '과학'
-          WHEN a.category IN ('국제','세계') THEN '세계'
-          WHEN a.category='경제' THEN '경제'
-          WHEN a.category='정치' THEN '정치'
-          WHEN a.category='사회' THEN '사회'
-          ELSE COALESCE(a.category,'기타')
-        END
-    """
+    else:
+        label_case = ARTICLE_LABEL_CASE_SQL
+        read_label = READ_LABEL_CASE_SQL
 
-    # 감정/신뢰도 포함
-    base_sql_tmpl = f"""
-    WITH base AS (
+    # 최근 1일 카테고리별 읽음 수
+    read_counts_cte = f"""
+    read_counts AS (
+      SELECT
+        {read_label} AS label,
+        COUNT(*) AS cnt
+      FROM article_reads r
+      LEFT JOIN original_article a ON a.id = r.article_id
+      WHERE r.user_id = :uid
+        AND r.opened_at >= :since
+      GROUP BY label
+    ),
+    label_limits AS (
+      SELECT label,
+             CASE WHEN cnt >= 10 THEN 6 WHEN cnt >= 5 THEN 5 ELSE 3 END AS lim
+      FROM read_counts
+      WHERE label IS NOT NULL
+    )"""
+
+    # 후보 우선순위(src_pri)
+    #   0: 최근 N일 기사 (시드 셔플: 64비트 해시, md5 hex보다 저렴)
+    #   1: 그 이전 기사 (시드 셔플)
+    #   2: 최근 1일 내 읽은 기사 (exclude_read일 때만, 최신순 보충)
+    read_cte = ""
+    read_join = ""
+    read_tier = ""
+    if exclude_read:
+        read_cte = """,
+    recent_reads AS (
+      SELECT DISTINCT article_id
+      FROM article_reads
+      WHERE user_id = :uid
+        AND opened_at >= :since
+    )"""
+        read_join = "LEFT JOIN recent_reads rr ON rr.article_id = a.id"
+        read_tier = "WHEN rr.article_id IS NOT NULL THEN 2"
+
+    return text(f"""
+    WITH {read_counts_cte}{read_cte},
+    base AS (
       SELECT
-        a.id, a.title, a.press, a.category, a.thumbnail_url,
-        a.published_at, a.scraped_at,
+        a.id, a.title, a.press, a.category, a.thumbnail_url, a.published_at,
         {label_case} AS label,
-        {ATTITUDE_CASE_SQL} AS attitude,
-        sa.confidence AS attitude_confidence
+        COALESCE(a.published_at, a.scraped_at) AS ts,
+        CASE
+          {read_tier}
+          WHEN COALESCE(a.published_at, a.scraped_at) >= :from_ts THEN 0
+          ELSE 1
+        END AS src_pri
       FROM original_article a
-      LEFT JOIN sentiment_articles sa
-        ON sa.original_article_id = a.id
-      WHERE 1=1
-        {{date_clause}}
-        AND ({label_case}) IN {label_allow}
-        {{exclude_clause}}
+      {read_join}
+      WHERE ({label_case}) IN {label_allow}
     ),
     ranked AS (
       SELECT
         id, title, press, category, thumbnail_url, published_at, label,
-        attitude, attitude_confidence,
-        ROW_NUMBER() OVER (PARTITION BY label ORDER BY md5(id::text || :seed)) AS rn
+        ROW_NUMBER() OVER (
+          PARTITION BY label
+          ORDER BY src_pri,
+                   CASE WHEN src_pri < 2 THEN hashtextextended(id::text, :seed_key) END,
+                   ts DESC NULLS LAST, id DESC
+        ) AS rn
       FROM base
     )
-    SELECT id, title, press, category, thumbnail_url, published_at, label,
-           attitude, attitude_confidence, rn
-    FROM ranked
-    WHERE rn <= :max_limit
-    """
-    sql_1 = text(base_sql_tmpl.format(date_clause=date_clause, exclude_clause=exclude_clause))
-    params_1 = {"uid": uid, "seed": seed, "days": int(days_back), "max_limit": int(max_limit)}
-    rows = (await session.execute(sql_1, params_1)).mappings().all()
+    SELECT rc.read_counts, p.*
+    FROM (
+      SELECT COALESCE(json_object_agg(label, cnt) FILTER (WHERE label IS NOT NULL), '{{}}'::json)
+             AS read_counts
+      FROM read_counts
+    ) rc
+    LEFT JOIN (
+      -- 카테고리별 한도(label_limits, 기본 3)까지만 남긴 뒤, 남은 행에만 감정 조인
+      SELECT a.id, a.title, a.press, a.category, a.thumbnail_url, a.published_at, a.label,
+             sa.sentiment_classification AS raw_attitude,
+             sa.confidence AS attitude_confidence,
+             a.rn
+      FROM (
+        SELECT k.*
+        FROM ranked k
+        LEFT JOIN label_limits ll ON ll.label = k.label
+        WHERE k.rn <= COALESCE(ll.lim, 3)
+      ) a
+      {SENTI_ONE_JOIN_SQL}
+    ) p ON TRUE
+    ORDER BY p.label, p.rn
+    """)
 
-    bucket: Dict[str, List[Dict[str, Any]]] = {c: [] for c in DISPLAY_CATEGORIES}
-    for r in rows:
-        c = r["label"]
-        if c in bucket and len(bucket[c]) < limits[c]:
-            bucket[c].append({
-                "id": r["id"],
-                "title": r["title"],
-                "category": r["category"],
-                "press": r["press"],
-                "published_at": r["published_at"],
-                "thumbnail_url": r["thumbnail_url"],
-                "attitude": r.get("attitude"),
-                "attitude_confidence": r.get("attitude_confidence"),
-            })
-
-    def shortages() -> Dict[str, int]:
-        return {c: (limits[c] - len(bucket[c])) for c in DISPLAY_CATEGORIES if len(bucket[c]) < limits[c]}
-
-    short = shortages()
-
-    if short:
-        sql_2 = text(base_sql_tmpl.format(date_clause="", exclude_clause=exclude_clause))
-        params_2 = {"uid": uid, "seed": seed, "max_limit": int(max_limit)}
-        rows2 = (await session.execute(sql_2, params_2)).mappings().all()
-        for r in rows2:
-            c = r["label"]
-            if c in bucket and len(bucket[c]) < limits[c]:
-                bucket[c].append({
-                    "id": r["id"],
-                    "title": r["title"],
-                    "category": r["category"],
-                    "press": r["press"],
-                    "published_at": r["published_at"],
-                    "thumbnail_url": r["thumbnail_url"],
-                    "attitude": r.get("attitude"),
-                    "attitude_confidence": r.get("attitude_confidence"),
-                })
-        short = shortages()
-
-    if short:
-        max_need = max(short.values())
-        fill_sql = text(f"""
-        WITH base AS (
-          SELECT
-            a.id, a.title, a.press, a.category, a.thumbnail_url,
-            a.published_at, a.scraped_at,
-            {label_case} AS label,
-            {ATTITUDE_CASE_SQL} AS attitude,
-            sa.confidence AS attitude_confidence,
-            COALESCE(a.published_at, a.scraped_at) AS ts
-          FROM original_article a
-          LEFT JOIN sentiment_articles sa
-            ON sa.original_article_id = a.id
-          WHERE ({label_case}) IN {label_allow}
+
+# 홈 피드 응답 캐시: (user, 오늘 seed, exclude_read) → 응답
+#  - 같은 날 같은 사용자 결과는 읽음 수가 바뀌기 전까지 동일 → 짧은 TTL로 재사용
+#  - 새 읽음(open_read) 시 해당 사용자 항목을 바로 무효화
+#  - 저장/반환 모두 깊은 복사본 → 호출 측이 응답을 수정해도 캐시 항목은 그대로
+_HOME_FEED_CACHE = _TTLCache(HOME_FEED_CACHE_SIZE, HOME_FEED_CACHE_TTL)
+
+
+def _invalidate_home_feed(uid: int) -> None:
+    seed = _daily_seed(uid, date.today())
+    for exclude_read in (True, False):
+        _HOME_FEED_CACHE.pop((uid, seed, exclude_read))
+
+
+async def get_home_feed(
+    session: AsyncSession,
+    user_id: str,
+    *,
+    exclude_read: bool = True,
+) -> Dict[str, Any]:
+    uid = int(user_id)
+    seed = _daily_seed(uid, date.today())
+    days_back = FEED_LOOKBACK_DAYS
+
+    cache_key = (uid, seed, bool(exclude_read))
+    cached = _HOME_FEED_CACHE.get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    since = _utc_now() - timedelta(days=1)
+
+    caps = await _get_senti_caps(session)
+    sql = _home_feed_sql(bool(exclude_read), caps.has_article_label)
+
+    # 읽음 수 + 카테고리별 후보를 1회 조회.
+    # 기사가 하나도 없어도 읽음 수 행 1개는 반환(LEFT JOIN ON TRUE)
+    params = {
+        "uid": uid, "seed_key": int(seed, 16), "since": since,
+        # CURRENT_DATE - N days 와 동일 (UTC 자정)
+        "from_ts": datetime.combine(
+            _utc_now().date() - timedelta(days=int(days_back)), datetime.min.time()
         ),
-        ranked AS (
-          SELECT
-            id, title, press, category, thumbnail_url, published_at, label, ts,
-            attitude, attitude_confidence,
-            ROW_NUMBER() OVER (PARTITION BY label ORDER BY ts DESC NULLS LAST, id DESC) AS rn
-          FROM base
-        )
-        SELECT id, title, press, category, thumbnail_url, published_at, label,
-               attitude, attitude_confidence, rn
-        FROM ranked
-        WHERE rn <= :max_need
-        """)
-        rows3 = (await session.execute(fill_sql, {"max_need": int(max_need)})).mappings().all()
-        for r in rows3:
-            c = r["label"]
-            if c in bucket and len(bucket[c]) < limits[c]:
-                bucket[c].append({
-                    "id": r["id"],
-                    "title": r["title"],
-                    "category": r["category"],
-                    "press": r["press"],
-                    "published_at": r["published_at"],
-                    "thumbnail_url": r["thumbnail_url"],
-                    "attitude": r.get("attitude"),
-                    "attitude_confidence": r.get("attitude_confidence"),
-                })
+    }
+    result = (await session.execute(sql, params)).mappings().all()
+
+    raw_counts = result[0]["read_counts"] if result else {}
+    if isinstance(raw_counts, str):
+        raw_counts = _json_loads(raw_counts)
+    read_counts: Dict[str, int] = {c: int((raw_counts or {}).get(c, 0)) for c in DISPLAY_CATEGORIES}
+
+    limits: Dict[str, int] = {}
+    for c in DISPLAY_CATEGORIES:
+        rc = read_counts.get(c, 0)
+        limits[c] = 6 if rc >= 10 else (5 if rc >= 5 else 3)
+
+    # 한도는 SQL에서 이미 적용됨 — 아래 길이 검사는 안전장치
+    bucket: Dict[str, List[Dict[str, Any]]] = {c: [] for c in DISPLAY_CATEGORIES}
+    cols = _FEED_ITEM_COLS
+    for r in result:
+        if r["id"] is None:
+            continue
+        items = bucket.get(r["label"])
+        if items is not None and len(items) < limits[r["label"]]:
+            item = {k: r[k] for k in cols}
+            item["attitude"] = _classify_attitude(r["raw_attitude"])
+            items.append(item)
 
     order_for_all = sorted(DISPLAY_CATEGORIES, key=lambda c: (-read_counts.get(c, 0), c))
 
@@ -1059,16 +1263,41 @@ async def get_home_feed(
         for c in order_for_all
     ]
 
-    return {
+    feed = {
         "date": date.today().isoformat(),
         "seed": seed,
         "order_for_all": order_for_all,
         "sections": sections,
     }
+    _HOME_FEED_CACHE.set(cache_key, copy.deepcopy(feed))
+    return feed
 
 # ------------------------------------------------------------------------------ #
 # Mood: 기록/스냅샷
 # ------------------------------------------------------------------------------ #
+async def record_mood_events_bulk(
+    session: AsyncSession, events: List[Dict[str, Any]]
+) -> List[int]:
+    """user_events에 event_type='mood' 여러 건을 INSERT 1회(RETURNING id)로 기록"""
+    if not events:
+        return []
+    now = datetime.utcnow()
+    rows = [
+        {
+            "user_id": int(e["user_id"]),
+            "event_type": "mood",
+            "article_id": e.get("article_id"),
+            "meta": {"delta": int(e["delta"]), "reason": e.get("reason"), "attitude": e.get("attitude")},
+            "ts": e.get("ts") or now,
+        }
+        for e in events
+    ]
+    stmt = insert(UserEvent).returning(UserEvent.id, sort_by_parameter_order=True)
+    ids = (await session.execute(stmt, rows)).scalars().all()
+    await session.commit()
+    return [int(i) for i in ids]
+
+
 async def record_mood_event(
     session: AsyncSession,
     user_id: str,
@@ -1079,49 +1308,55 @@ async def record_mood_event(
     ts: Optional[datetime] = None,
 ) -> int:
     """user_events에 event_type='mood' 로 한 줄 기록"""
-    now = ts or datetime.utcnow()
-    obj = UserEvent(
-        user_id=int(user_id),
-        event_type="mood",
-        article_id=article_id,
-        meta={"delta": int(delta), "reason": reason, "attitude": attitude},
-        ts=now,
+    ids = await record_mood_events_bulk(
+        session,
+        [{
+            "user_id": user_id,
+            "delta": delta,
+            "reason": reason,
+            "attitude": attitude,
+            "article_id": article_id,
+            "ts": ts,
+        }],
     )
-    session.add(obj)
-    await session.flush()
-    await session.commit()
-    return int(obj.id)
-
+    return ids[0]
 
 
 async def get_user_mood_snapshot(session: AsyncSession, user_id: str, *, days: int = 7) -> Dict[str, Any]:
     days = 7
 
-    # ✅ KST now / event ts(KST)
-    seoul_now = _now_kst()
+    # ✅ event ts(KST) — 오늘 날짜(KST)는 DB 왕복 없이 Python에서 계산
     seoul_ts = _to_kst(UserEvent.ts)
 
     day_str = func.to_char(func.date_trunc("day", seoul_ts), "YYYY-MM-DD").label("day")
 
-    delta_text = func.jsonb_extract_path_text(UserEvent.meta.cast(JSONB), 'delta')
-    sum_delta = func.coalesce(
-        func.sum(
-            case(
-                (delta_text.op('~')('^-?[0-9]+(\\.[0-9]+)?$'), cast(delta_text, Numeric())),
-                else_=0.0,
-            )
-        ),
-        0.0,
-    ).label("sum_delta")
+    # meta.delta가 JSON 숫자인 행만 합산 (생성 컬럼이 있으면 그대로 사용)
+    caps = await _get_senti_caps(session)
+    if caps.has_event_delta:
+        delta_num = literal_column("user_events.delta")
+    else:
+        meta_delta = UserEvent.meta.cast(JSONB)["delta"]
+        delta_type = func.jsonb_typeof(meta_delta)
+        # 숫자: (meta->'delta')::numeric — 텍스트 변환/정규식 없이 바로 numeric으로
+        # 숫자 문자열("5" 등): 기존과 같이 정규식 검사 후 변환 (문자열 행에서만 실행)
+        delta_num = case(
+            (delta_type == "number", cast(meta_delta, Numeric())),
+            (
+                and_(delta_type == "string", meta_delta.astext.op("~")(DELTA_NUMERIC_RE)),
+                cast(meta_delta.astext, Numeric()),
+            ),
+        )
+    sum_delta = func.coalesce(func.sum(delta_num), 0.0).label("sum_delta")
 
-    window_start = seoul_now - text(f"interval '{int(days)} day'")
+    # ts(naive UTC)를 직접 비교해야 인덱스 범위 스캔 가능 (KST 변환 후 비교와 같은 구간)
+    window_start = _utc_now() - timedelta(days=int(days))
 
     q = (
         select(day_str, sum_delta)
         .where(
             UserEvent.user_id == int(user_id),
             UserEvent.event_type.in_(["mood", "stress_delta"]),
-            seoul_ts >= window_start,
+            UserEvent.ts >= window_start,
         )
         .group_by(day_str)
         .order_by(day_str.asc())
@@ -1129,18 +1364,17 @@ async def get_user_mood_snapshot(session: AsyncSession, user_id: str, *, days: i
     rows = (await session.execute(q)).all()
     m = {r.day: float(r.sum_delta or 0.0) for r in rows}
 
-    today_str = (
-        await session.execute(
-            select(func.to_char(func.date_trunc("day", seoul_now), "YYYY-MM-DD"))
-        )
-    ).scalar_one()
-
-    today_date = datetime.strptime(today_str, "%Y-%m-%d").date()
-    days_list = []
-    for i in range(days - 1, -1, -1):
-        d = (today_date - timedelta(days=i)).isoformat()
-        score = BASELINE_STRESS + m.get(d, 0.0)
-        days_list.append({"date": d, "score": int(round(score))})
+    today_date = datetime.now(KST_TZ).date()
+    today_str = today_date.isoformat()
+    # (date, iso) 쌍을 한 번만 만들어 아래 요일 집계에서 재사용 (문자열 재파싱 없음)
+    day_pairs = [
+        (dt, dt.isoformat())
+        for dt in (today_date - timedelta(days=i) for i in range(days - 1, -1, -1))
+    ]
+    days_list = [
+        {"date": iso, "score": int(round(BASELINE_STRESS + m.get(iso, 0.0)))}
+        for _, iso in day_pairs
+    ]
 
     today_score = days_list[-1]["score"] if days_list else BASELINE_STRESS
 
@@ -1152,8 +1386,7 @@ async def get_user_mood_snapshot(session: AsyncSession, user_id: str, *, days: i
     else:         emoji, word = "😣", "불안"
 
     week_bins = [{"dow": i, "cnt": 0, "sum": 0, "avg": None} for i in range(7)]
-    for d in days_list:
-        dt = datetime.strptime(d["date"], "%Y-%m-%d").date()
+    for (dt, _), d in zip(day_pairs, days_list):
         dow = (dt.weekday() + 1) % 7
         week_bins[dow]["cnt"] += 1
         week_bins[dow]["sum"] += d["score"]
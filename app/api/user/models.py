@@ -15,11 +15,13 @@ class User(Base):
     password = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # async 환경에서 암묵적 lazy load(N+1/MissingGreenlet) 방지 → 필요하면 selectinload로 명시 로드
     sessions = relationship(
         "UserSession",
         back_populates="user",
         cascade="all, delete-orphan",
         passive_deletes=True,
+        lazy="raise",
     )
 
 
@@ -31,4 +33,4 @@ class UserSession(Base):
     started_at = Column(DateTime, nullable=True)
     ended_at = Column(DateTime, nullable=True)
 
-    user = relationship("User", back_populates="sessions")
+    user = relationship("User", back_populates="sessions", lazy="raise")
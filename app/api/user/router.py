@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 import httpx
@@ -37,9 +37,13 @@ async def create_user(
     return UserResponse(id=u.id, name=u.name, email=u.email, created_at=u.created_at)
 
 @router.get("/", response_model=List[UserResponse])
-async def get_users(db: AsyncSession = Depends(get_session)):
+async def get_users(
+    after: int = Query(0, ge=0, description="이 id 다음부터 조회 (이전 페이지의 마지막 id)"),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_session),
+):
     svc = UserService(db)
-    rows = await svc.get_users()
+    rows = await svc.get_users(after=after, limit=limit)
     return [UserResponse(id=u.id, name=u.name, email=u.email, created_at=u.created_at) for u in rows]
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -66,18 +70,14 @@ async def delete_user(user_id: int, db: AsyncSession = Depends(get_session)):
 # ---------------- Auth ----------------
 @router.post("/login", response_model=UserResponse)
 async def login(
-    email: Optional[str] = Query(None),
-    password: Optional[str] = Query(None),
-    body: Optional[LoginBody] = Body(None),
+    body: LoginBody,
     db: AsyncSession = Depends(get_session),
 ):
-    em = email if email is not None else (body.email if body else None)
-    pw = password if password is not None else (body.password if body else None)
-    if not em or not pw:
+    if not body.email or not body.password:
         raise HTTPException(status_code=400, detail="email and password are required")
 
     svc = UserService(db)
-    user = await svc.login(em, pw)
+    user = await svc.login(body.email, body.password)
     if not user:
         raise HTTPException(status_code=401, detail="잘못된 이메일 또는 비밀번호입니다.")
     return UserResponse(id=user.id, name=user.name, email=user.email, created_at=user.created_at)
@@ -96,32 +96,20 @@ async def signup(
 # ---------------- Sessions ----------------
 @router.post("/session/start", response_model=SessionStartResponse, status_code=status.HTTP_201_CREATED)
 async def session_start(
-    user_id: Optional[int] = Query(None),
-    body: Optional[SessionStartBody] = Body(None),
+    body: SessionStartBody,
     db: AsyncSession = Depends(get_session),
 ):
-    uid = user_id if user_id is not None else (body.user_id if body else None)
-    if uid is None:
-        raise HTTPException(400, detail="user_id is required")
-
     svc = UserService(db)
-    sid = await svc.start_session(uid)
+    sid = await svc.start_session(body.user_id)
     return SessionStartResponse(session_id=sid)
 
 @router.post("/session/end", response_model=SessionEndResponse)
 async def session_end(
-    user_id: Optional[int] = Query(None),
-    session_id: Optional[int] = Query(None),
-    body: Optional[SessionEndBody] = Body(None),
+    body: SessionEndBody,
     db: AsyncSession = Depends(get_session),
 ):
-    uid = user_id if user_id is not None else (body.user_id if body else None)
-    sid = session_id if session_id is not None else (body.session_id if body else None)
-    if uid is None or sid is None:
-        raise HTTPException(400, detail="user_id and session_id are required")
-
     svc = UserService(db)
-    seconds = await svc.end_session(session_id=sid, user_id=uid)
+    seconds = await svc.end_session(session_id=body.session_id, user_id=body.user_id)
     if seconds < 0:
         raise HTTPException(404, detail="session not found")
     return SessionEndResponse(ok=True, seconds=seconds)
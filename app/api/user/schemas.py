@@ -14,7 +14,7 @@ class UserResponse(BaseModel):
     email: str
     created_at: datetime | None = None
 
-# ---- Auth/Login body (선택) ----
+# ---- Auth/Login body ----
 class LoginBody(BaseModel):
     email: str
     password: str
@@ -1,14 +1,41 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
-from sqlalchemy import select, func, text
+from sqlalchemy import select, insert, update, delete, func, text, bindparam, DateTime
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .models import User, UserSession
 
 KST = "Asia/Seoul"
 
+# 자주 쓰는 고정 구문은 모듈 로드 시 1회만 생성, 값은 bindparam으로 전달
+# (ORM 객체를 들고 있지 않으므로 UPDATE/DELETE의 세션 동기화는 생략)
+_SEL_USERS_PAGE = (
+    select(User.id, User.name, User.email, User.created_at)
+    .where(User.id > bindparam("after"))
+    .order_by(User.id)
+    .limit(bindparam("limit"))
+)
+_SEL_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_DEL_USER = (
+    delete(User)
+    .where(User.id == bindparam("uid"))
+    .returning(User.id)
+    .execution_options(synchronize_session=False)
+)
+_END_SESSION = (
+    update(UserSession)
+    .where(
+        UserSession.id == bindparam("sid"),
+        UserSession.user_id == bindparam("uid"),
+    )
+    .values(ended_at=func.coalesce(UserSession.ended_at, bindparam("now", type_=DateTime())))
+    .returning(UserSession.started_at, UserSession.ended_at)
+    .execution_options(synchronize_session=False)
+)
+
 
 class UserService:
     def __init__(self, session: AsyncSession):
@@ -16,38 +43,46 @@ class UserService:
 
     # ---------- Users ----------
     async def create_user(self, name: str, email: str, password: str) -> User:
-        user = User(name=name, email=email, password=password)
-        self.session.add(user)
+        # INSERT ... RETURNING 으로 id/created_at까지 받아옴 (commit 후 refresh 불필요)
+        user = (
+            await self.session.execute(
+                insert(User).values(name=name, email=email, password=password).returning(User)
+            )
+        ).scalar_one()
         await self.session.commit()
-        await self.session.refresh(user)
         return user
 
-    async def get_users(self) -> List[User]:
-        result = await self.session.execute(select(User))
-        return list(result.scalars().all())
+    async def get_users(self, after: int = 0, limit: int = 100) -> List[Row]:
+        # 키셋 페이지네이션: id > after 부터 limit건 (PK 인덱스 범위 스캔)
+        # 읽기 전용 목록이므로 ORM 객체 대신 응답에 필요한 컬럼만 Row로 반환
+        result = await self.session.execute(_SEL_USERS_PAGE, {"after": after, "limit": limit})
+        return result.all()
 
     async def update_user(self, user_id: int, name: str, email: str, password: Optional[str] = None) -> Optional[User]:
-        user = (await self.session.execute(select(User).where(User.id == user_id))).scalars().one_or_none()
+        values = {"name": name, "email": email}
+        if password is not None:
+            values["password"] = password
+        # 조회 → 변경 → refresh 대신 UPDATE ... RETURNING 1회
+        user = (
+            await self.session.execute(
+                update(User).where(User.id == user_id).values(**values).returning(User)
+            )
+        ).scalars().one_or_none()
         if not user:
             return None
-        user.name = name
-        user.email = email
-        if password is not None:
-            user.password = password
         await self.session.commit()
-        await self.session.refresh(user)
         return user
 
     async def delete_user(self, user_id: int) -> bool:
-        user = (await self.session.execute(select(User).where(User.id == user_id))).scalars().one_or_none()
-        if not user:
+        # user_sessions는 FK ON DELETE CASCADE로 DB에서 함께 삭제 (ORM으로 세션 목록을 불러오지 않음)
+        deleted = (await self.session.execute(_DEL_USER, {"uid": user_id})).scalar_one_or_none()
+        if deleted is None:
             return False
-        await self.session.delete(user)
         await self.session.commit()
         return True
 
     async def login(self, email: str, password: str) -> Optional[User]:
-        user = (await self.session.execute(select(User).where(User.email == email))).scalars().one_or_none()
+        user = (await self.session.execute(_SEL_USER_BY_EMAIL, {"email": email})).scalars().one_or_none()
         if not user or user.password != password:
             return None
         return user
@@ -56,29 +91,28 @@ class UserService:
     async def start_session(self, user_id: int) -> int:
         # 컬럼이 timestamp(naive)이므로 UTC now에서 tz를 제거해 저장(= naive UTC)
         now = datetime.now(timezone.utc).replace(tzinfo=None)
-        row = UserSession(user_id=user_id, started_at=now)
-        self.session.add(row)
-        await self.session.flush()  # id 확보
-        sid = row.id
+        # INSERT ... RETURNING id 로 id 확보 (별도 flush 없이 commit만)
+        sid = (
+            await self.session.execute(
+                insert(UserSession)
+                .values(user_id=user_id, started_at=now)
+                .returning(UserSession.id)
+            )
+        ).scalar_one()
         await self.session.commit()
         return sid
 
     async def end_session(self, session_id: int, user_id: int) -> int:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        # 이미 종료된 세션은 ended_at 유지, 조회 없이 UPDATE ... RETURNING 1회
         row = (
             await self.session.execute(
-                select(UserSession).where(
-                    UserSession.id == session_id,
-                    UserSession.user_id == user_id,
-                )
+                _END_SESSION, {"sid": session_id, "uid": user_id, "now": now}
             )
-        ).scalars().one_or_none()
+        ).one_or_none()
         if not row:
             return -1
 
-        now = datetime.now(timezone.utc).replace(tzinfo=None)
-        if row.ended_at is None:
-            row.ended_at = now
-
         seconds = 0
         if row.started_at is not None:
             seconds = max(0, int((row.ended_at - row.started_at).total_seconds()))
@@ -90,6 +124,7 @@ class UserService:
         """
         저장: started_at/ended_at = naive UTC(timestamp)
         집계: KST 로컬 기준. 세션을 시간 경계(…:00~…:59)로 쪼개 각 시간대 교집합만 합산.
+              (DB는 윈도우로 자른 세션 구간만 반환, 시간대 분할은 Python에서)
         mode: "day"(오늘 0~24 KST) | "week"(이번 주 KST) | "rolling"(최근 N일 KST)
         반환: 길이 24의 '분' 단위 합계
         """
@@ -135,30 +170,9 @@ clipped AS (
   CROSS JOIN bounds b
   WHERE s.end_local > b.start_local
     AND s.start_local < b.end_local
-),
--- 3) 세션을 시간 단위로 분할(0분 경계 기준) 후, 각 시간대 교집합 길이 계산
-expanded AS (
-  SELECT
-    h AS bucket_start,
-    LEAST(c.s_end, h + interval '1 hour') AS bucket_end,
-    GREATEST(c.s_start, h)                 AS bucket_real_start
-  FROM clipped c
-  JOIN LATERAL generate_series(
-        date_trunc('hour', c.s_start),
-        date_trunc('hour', c.s_end - interval '1 second'),
-        interval '1 hour'
-      ) AS h ON TRUE
-),
-agg AS (
-  SELECT
-    EXTRACT(HOUR FROM bucket_start)::int AS hour,
-    SUM(GREATEST(EXTRACT(EPOCH FROM (bucket_end - bucket_real_start)), 0))::bigint AS seconds
-  FROM expanded
-  GROUP BY 1
 )
-SELECT hour, seconds
-FROM agg
-ORDER BY hour;
+SELECT s_start, s_end
+FROM clipped;
             """
         )
 
@@ -171,9 +185,13 @@ ORDER BY hour;
 
         rows = (await self.session.execute(sql, params)).all()
 
-        bins = [0] * 24
-        for h, sec in rows:
-            hour = int(h)
-            seconds = int(sec or 0)
-            bins[hour] = max(0, round(seconds / 60.0))  # 분 단위
-        return bins
+        # 3) 세션을 정시 경계로 잘라 시간대별 초 합산
+        seconds = [0.0] * 24
+        for s_start, s_end in rows:
+            t = s_start
+            while t < s_end:
+                hour_end = min(s_end, t.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1))
+                seconds[t.hour] += (hour_end - t).total_seconds()
+                t = hour_end
+
+        return [max(0, round(sec / 60.0)) for sec in seconds]  # 분 단위
@@ -1,14 +1,30 @@
 # app/config.py
 import os
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
-# .env 로드 (이 모듈이 임포트될 때 즉시)
-load_dotenv()
+
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """.env 로드 (프로세스당 1회). 환경변수를 읽는 모듈은 import 직후 이걸 호출."""
+    load_dotenv()
+
+
+load_env()
+
 
 class Settings:
-    # 팀원(추천) 서버 베이스 URL
-    EXTERNAL_API_BASE_URL: str = os.getenv("EXTERNAL_API_BASE_URL", "").rstrip("/")
-    # (선택) 추천 호출 타임아웃(초)
-    RECO_API_TIMEOUT: float = float(os.getenv("RECO_API_TIMEOUT", "8"))
+    def __init__(self) -> None:
+        # 팀원(추천) 서버 베이스 URL
+        self.EXTERNAL_API_BASE_URL: str = os.getenv("EXTERNAL_API_BASE_URL", "").rstrip("/")
+        # (선택) 추천 호출 타임아웃(초)
+        self.RECO_API_TIMEOUT: float = float(os.getenv("RECO_API_TIMEOUT", "8"))
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    return Settings()
+
 
-settings = Settings()
+settings = get_settings()
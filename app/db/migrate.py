@@ -0,0 +1,150 @@
+# app/db/migrate.py
+"""
+스키마(테이블/인덱스/생성 컬럼) 1회 적용 스크립트.
+
+    python -m app.db.migrate
+
+배포 시 앱을 띄우기 전에 이 스크립트를 먼저 실행 (앱은 기본적으로 부팅 시 DDL을 실행하지 않음).
+테이블을 다시 쓰는 DDL(생성 컬럼 추가 등)과 기존 테이블의 인덱스는 앱 부팅 경로
+(create_db_and_tables)에 두지 않고 아래 MIGRATIONS 에만 둠.
+  - 모든 구문은 IF NOT EXISTS 로 여러 번 실행해도 안전
+  - 인덱스는 CREATE INDEX CONCURRENTLY(쓰기 차단 없음) → 트랜잭션 밖(autocommit)에서 실행
+  - CONCURRENTLY 가 중간에 실패해 남은 INVALID 인덱스는 다음 실행 때 지우고 다시 만듦
+"""
+import asyncio
+
+from sqlalchemy import text
+
+from app.db.session import engine, create_db_and_tables, dispose_engine
+# 메타데이터에 테이블이 등록되도록 모델 모듈 임포트 (label 생성식도 여기서)
+from app.api.news.models import ARTICLE_LABEL_DDL, DELTA_NUMERIC_RE
+
+# (이름, SQL) — 순서대로 적용. 인덱스 항목의 이름은 인덱스 이름과 같게 둠
+MIGRATIONS = (
+    # 목록 조회(ORDER BY published_at DESC NULLS LAST, id DESC) + category/press 필터용
+    (
+        "ix_original_article_category_published",
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_original_article_category_published
+          ON original_article (category, published_at DESC NULLS LAST, id DESC)
+        """,
+    ),
+    (
+        "ix_original_article_published",
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_original_article_published
+          ON original_article (published_at DESC NULLS LAST, id DESC)
+        """,
+    ),
+    (
+        "ix_original_article_press",
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_original_article_press
+          ON original_article (press)
+        """,
+    ),
+    (
+        "original_article.label",
+        f"""
+        ALTER TABLE original_article
+          ADD COLUMN IF NOT EXISTS label text GENERATED ALWAYS AS ({ARTICLE_LABEL_DDL}) STORED
+        """,
+    ),
+    (
+        "ix_original_article_label_published",
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_original_article_label_published
+          ON original_article (label, published_at DESC NULLS LAST, id DESC)
+        """,
+    ),
+    # 사용자별 기간 조회(user_id + opened_at 범위) → 집계 컬럼 포함으로 index-only scan
+    (
+        "ix_article_reads_user_opened",
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_article_reads_user_opened
+          ON article_reads (user_id, opened_at DESC)
+          INCLUDE (dwell_seconds, article_id, closed_at)
+        """,
+    ),
+    # 기사 ↔ 감정 조인 키 (테이블이 있을 때만, OPTIONAL_TABLES 참고)
+    (
+        "ix_sentiment_articles_original_article",
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_sentiment_articles_original_article
+          ON sentiment_articles (original_article_id)
+          INCLUDE (sentiment_classification, confidence)
+        """,
+    ),
+    # 기분 스냅샷(user_id + mood/stress_delta + ts 범위)용 부분 인덱스
+    (
+        "ix_user_events_user_type_ts",
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_events_user_type_ts
+          ON user_events (user_id, event_type, ts DESC)
+          WHERE event_type IN ('mood', 'stress_delta')
+        """,
+    ),
+    (
+        # 기분 점수 변화량: meta.delta가 숫자 또는 숫자 문자열("5")이면 numeric, 아니면 NULL
+        # (스냅샷 집계 때 행마다 JSON 파싱/정규식 검사를 하지 않도록 저장 시점에 계산)
+        "user_events.delta",
+        f"""
+        ALTER TABLE user_events
+          ADD COLUMN IF NOT EXISTS delta numeric GENERATED ALWAYS AS (
+            CASE jsonb_typeof(meta::jsonb -> 'delta')
+              WHEN 'number' THEN (meta::jsonb -> 'delta')::numeric
+              WHEN 'string' THEN
+                CASE WHEN (meta::jsonb ->> 'delta') ~ '{DELTA_NUMERIC_RE}'
+                     THEN (meta::jsonb ->> 'delta')::numeric
+                END
+            END
+          ) STORED
+        """,
+    ),
+)
+
+# 다른 서비스가 관리하는 테이블 대상 항목: 테이블이 없으면 건너뜀
+OPTIONAL_TABLES = {
+    "ix_sentiment_articles_original_article": "sentiment_articles",
+}
+
+
+async def apply_migrations() -> None:
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for name, sql in MIGRATIONS:
+            table = OPTIONAL_TABLES.get(name)
+            if table is not None:
+                exists = (
+                    await conn.execute(text("SELECT to_regclass(:t) IS NOT NULL"), {"t": table})
+                ).scalar()
+                if not exists:
+                    print(f"INFO: Skipping {name} ({table} not found)")
+                    continue
+            if name.startswith("ix_"):
+                invalid = (
+                    await conn.execute(
+                        text(
+                            "SELECT NOT indisvalid FROM pg_index "
+                            "WHERE indexrelid = to_regclass(:name)"
+                        ),
+                        {"name": name},
+                    )
+                ).scalar()
+                if invalid:
+                    print(f"WARN: Rebuilding invalid index {name}")
+                    await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            print(f"INFO: Applying {name}")
+            await conn.execute(text(sql))
+
+
+async def main() -> None:
+    print("INFO: Creating database and tables...")
+    await create_db_and_tables()
+    await apply_migrations()
+    print("INFO: Database tables created successfully")
+    await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
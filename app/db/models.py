@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import func
 from typing import Optional
 from datetime import datetime
 
@@ -14,7 +15,11 @@ class Item(ItemBase, table=True):
     __tablename__ = "items"
     
     id: Optional[int] = Field(default=None, primary_key=True)
-    created_at: datetime = Field(default_factory=datetime.now)
+    # DB가 INSERT 시점에 채움 (Python 쪽 시계 호출 없음)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column_kwargs={"server_default": func.now(), "nullable": False},
+    )
     updated_at: Optional[datetime] = None
     is_active: bool = Field(default=True)
 
@@ -1,105 +1,22 @@
-# # app/db/session.py
-# import os
-# from typing import AsyncGenerator, Annotated
-
-# from dotenv import load_dotenv
-# from fastapi import Depends
-# from sqlalchemy.ext.asyncio import (
-#     AsyncSession,
-#     async_sessionmaker,
-#     create_async_engine,
-# )
-# from sqlalchemy.pool import NullPool
-# from sqlmodel import SQLModel
-
-# load_dotenv()
-
-# # ---------------------------------------------------------------------
-# # ENV
-# # ---------------------------------------------------------------------
-# DATABASE_URL = os.getenv(
-#     "DATABASE_URL",
-#     "postgresql+asyncpg://postgres.mzwydodxpnejiaxcktfu:jaksal2025@"
-#     "aws-0-ap-northeast-2.pooler.supabase.com:5432/postgres",
-# )
-
-# SQL_ECHO = os.getenv("SQL_ECHO", "0") in ("1", "true", "True", "YES", "yes")
-# POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "300"))
-
-# # Supabase pgbouncer(pooler) 사용 시 애플리케이션 풀은 끄는 게 안전
-# USE_NULLPOOL = (
-#     "pooler.supabase.com" in DATABASE_URL
-#     or os.getenv("DB_USE_NULLPOOL", "1") in ("1", "true", "True", "YES", "yes")
-# )
-
-# # ---------------------------------------------------------------------
-# # ENGINE
-# # ---------------------------------------------------------------------
-# engine_kwargs = dict(
-#     echo=SQL_ECHO,
-#     future=True,
-#     pool_pre_ping=True,
-# )
-
-# if USE_NULLPOOL:
-#     # PgBouncer 앞단에서는 SQLAlchemy 풀을 쓰지 않는 것이 안전
-#     engine_kwargs["poolclass"] = NullPool
-# else:
-#     engine_kwargs["pool_recycle"] = POOL_RECYCLE
-
-# engine = create_async_engine(DATABASE_URL, **engine_kwargs)
-
-# # ---------------------------------------------------------------------
-# # SESSION FACTORY
-# # ---------------------------------------------------------------------
-# AsyncSessionLocal = async_sessionmaker(
-#     bind=engine,
-#     class_=AsyncSession,
-#     expire_on_commit=False,
-#     autoflush=False,
-#     autocommit=False,
-# )
-
-# # ---------------------------------------------------------------------
-# # DEPENDENCY
-# # ---------------------------------------------------------------------
-# async def get_session() -> AsyncGenerator[AsyncSession, None]:
-#     async with AsyncSessionLocal() as session:
-#         try:
-#             yield session
-#         except Exception:
-#             await session.rollback()
-#             raise
-
-# SessionDep = Annotated[AsyncSession, Depends(get_session)]
-
-# # ---------------------------------------------------------------------
-# # OPTIONAL: DDL (필요할 때만 호출)
-# # ---------------------------------------------------------------------
-# async def create_db_and_tables() -> None:
-#     async with engine.begin() as conn:
-#         await conn.run_sync(SQLModel.metadata.create_all)
-
-# async def dispose_engine() -> None:
-#     await engine.dispose()
-
-
 # app/db/session.py
 import os
+import asyncio
 from typing import AsyncGenerator, Annotated
-import ssl
+from uuid import uuid4
 
-from dotenv import load_dotenv
 from fastapi import Depends
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from sqlmodel import SQLModel
 
-load_dotenv()
+from app.config import load_env
+
+load_env()
 
 # ---------------------------------------------------------------------
 # ENV
@@ -111,49 +28,57 @@ DATABASE_URL = os.getenv(
 )
 
 SQL_ECHO = os.getenv("SQL_ECHO", "0") in ("1", "true", "True", "YES", "yes")
-POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "300"))
 
-# Supabase pgbouncer(pooler) 사용 시 애플리케이션 풀은 끄는 게 안전
-USE_NULLPOOL = (
+# Supabase pooler(PgBouncer/Supavisor) 경유 여부
+USE_PGBOUNCER = (
     "pooler.supabase.com" in DATABASE_URL
-    or os.getenv("DB_USE_NULLPOOL", "1") in ("1", "true", "True", "YES", "yes")
+    or os.getenv("DB_PGBOUNCER", "0") in ("1", "true", "True", "YES", "yes")
 )
 
-# ----- 여기 추가: SSL 컨텍스트 -----
-ssl_ctx = ssl.create_default_context()
-ssl_ctx.check_hostname = True
-ssl_ctx.verify_mode = ssl.CERT_REQUIRED
-# ----------------------------------
+# 풀러 앞에서도 앱 풀로 TCP/인증 연결을 재사용 (요청마다 새 연결 X)
+#  - NullPool이 꼭 필요하면 DB_USE_NULLPOOL=1
+USE_NULLPOOL = os.getenv("DB_USE_NULLPOOL", "0") in ("1", "true", "True", "YES", "yes")
 
-engine_kwargs = dict(
-    echo=SQL_ECHO,
-    future=True,
-    pool_pre_ping=True,
-    connect_args={"ssl": ssl_ctx},      # ← 핵심: asyncpg에 SSL 적용
-    # 참고: PgBouncer(transaction 모드)라면 아래 캐시 비활성화를 권장하기도 함
-    # connect_args={"ssl": ssl_ctx, "statement_cache_size": 0},
-)
+# 앱 풀(AsyncAdaptedQueuePool) 크기 — 워커당 동시 요청 수에 맞춰 조정
+#  - 풀러 경유 시: 풀러의 클라이언트 연결 수를 아끼도록 overflow를 작게,
+#    풀러 idle timeout보다 짧게 재활용
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5" if USE_PGBOUNCER else "20"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "60" if USE_PGBOUNCER else "300"))
+POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
 
-if USE_NULLPOOL:
-    engine_kwargs["poolclass"] = NullPool
-else:
-    engine_kwargs["pool_recycle"] = POOL_RECYCLE
-
-engine = create_async_engine(DATABASE_URL, **engine_kwargs)
 # ---------------------------------------------------------------------
 # ENGINE
 # ---------------------------------------------------------------------
 engine_kwargs = dict(
     echo=SQL_ECHO,
     future=True,
-    pool_pre_ping=True,
+    # 풀러 경유 시 체크아웃마다 SELECT 1 왕복을 하지 않음 (짧은 recycle로 대신 관리)
+    pool_pre_ping=not USE_PGBOUNCER,
 )
 
+if USE_PGBOUNCER:
+    # transaction 모드 풀러는 요청마다 다른 백엔드로 붙을 수 있어
+    # asyncpg 이름 있는 prepared statement가 충돌(DuplicatePreparedStatementError)
+    #  → 캐시를 끄고 statement 이름을 매번 고유하게
+    engine_kwargs["connect_args"] = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
 if USE_NULLPOOL:
-    # PgBouncer 앞단에서는 SQLAlchemy 풀을 쓰지 않는 것이 안전
     engine_kwargs["poolclass"] = NullPool
 else:
+    # 기본값(5+10)은 동시 요청이 몰리면 연결 대기가 생기므로 크기 지정
+    engine_kwargs["poolclass"] = AsyncAdaptedQueuePool
+    engine_kwargs["pool_size"] = POOL_SIZE
+    engine_kwargs["max_overflow"] = MAX_OVERFLOW
     engine_kwargs["pool_recycle"] = POOL_RECYCLE
+    engine_kwargs["pool_timeout"] = POOL_TIMEOUT
+    if USE_PGBOUNCER:
+        # LIFO: 최근 쓴 연결만 재사용 → 한가할 때 나머지는 idle로 남아 풀러가 정리
+        engine_kwargs["pool_use_lifo"] = True
 
 engine = create_async_engine(DATABASE_URL, **engine_kwargs)
 
@@ -185,8 +110,24 @@ SessionDep = Annotated[AsyncSession, Depends(get_session)]
 # OPTIONAL: DDL (필요할 때만 호출)
 # ---------------------------------------------------------------------
 async def create_db_and_tables() -> None:
+    # 없는 테이블만 생성. 기존 테이블 인덱스/컬럼 추가는 app/db/migrate.py 에서만
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
+async def warm_pool() -> None:
+    """
+    시작 시 풀 연결을 미리 열어 둠 (연결/TLS/인증 + asyncpg 코덱 설정을 첫 요청 전에 처리).
+    NullPool이면 보관할 연결이 없으므로 생략.
+    """
+    if USE_NULLPOOL:
+        return
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(POOL_SIZE)))
+
 async def dispose_engine() -> None:
-    await engine.dispose()
+    # 종료 중 취소가 들어와도 풀 연결 정리는 끝까지 진행
+    await asyncio.shield(engine.dispose())
@@ -1,87 +1,32 @@
-# from contextlib import asynccontextmanager
-# from fastapi import FastAPI #APIRouter
-# from app.db.session import create_db_and_tables, dispose_engine
-# from app.api.news.router import router as news_router
-# from app.api.user.router import router as user_router
-# from fastapi.middleware.cors import CORSMiddleware
-# from app.api.health.router import router as health_router
-# # from app.ai.router import router as ai_router
-# import os
-# from dotenv import load_dotenv
-
-# # .env 파일 불러오기
-# load_dotenv()
-
-
-# @asynccontextmanager
-# async def lifespan(app: FastAPI):
-#     """앱 생명주기 관리"""
-#     # 시작 시
-#     print("INFO: Creating database and tables...")
-#     await create_db_and_tables()
-
-#     print("INFO: Database tables created successfully")
-
-#     yield
-    
-#     # 종료 시
-#     print("INFO: Disposing database engine...")
-#     await dispose_engine()
-#     print("INFO: Database engine disposed")
-
-# app = FastAPI(
-#     title="News Main Server",
-#     description="FastAPI + Supabase PostgreSQL with SQLModel",
-#     version="1.0.0",
-#     lifespan=lifespan
-# )
-
-# app.add_middleware(
-#     CORSMiddleware,
-#     allow_origins=[
-#         "http://localhost:3000",
-#         "http://127.0.0.1:3000",
-#         # 배포 프론트 도메인 추가
-#     ],
-#     allow_credentials=True,
-#     allow_methods=["*"],
-#     allow_headers=["*"],
-# )
-
-
-
-# # 라우터 등록
-# app.include_router(news_router, prefix="/api")
-# app.include_router(user_router, prefix="/api")
-# app.include_router(health_router, prefix="/api/health", tags=["health"])
-# # app.include_router(ai_router, prefix="/api/sentiment", tags=["Sentiment"])
-
-# @app.get("/")
-# async def root():
-#     """루트 엔드포인트"""
-#     return {
-#         "message": "Item Management API",
-#         "version": "1.0.0",
-#         "docs": "/docs",
-#         "redoc": "/redoc"
-#     }
-
 # app/main.py
 from contextlib import asynccontextmanager
 import os
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-
-from app.db.session import create_db_and_tables, dispose_engine
-from app.api.news.router import router as news_router
+from fastapi.responses import JSONResponse
+
+try:  # orjson(C 확장)이 있으면 응답 JSON 인코딩을 orjson으로
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
+from app.config import load_env
+from app.db.session import AsyncSessionLocal, create_db_and_tables, dispose_engine, warm_pool
+from app.api.news.router import router as news_router, close_reco_client
+from app.api.news.service import load_senti_caps
 from app.api.user.router import router as user_router
 from app.api.health.router import router as health_router  # /api/health
 
-from dotenv import load_dotenv
+# .env 로드 (로컬 개발용, 프로세스당 1회)
+load_env()
 
-# .env 로드 (로컬 개발용)
-load_dotenv()
+# 실행: uvicorn app.main:app --workers N
+#  - uvicorn[standard] 설치 시 기본(auto)으로 uvloop 이벤트 루프 + httptools 파서 사용
+#    (명시하려면 --loop uvloop --http httptools)
+#  - 엔진/세션팩토리/httpx 클라이언트는 모듈 전역 1개씩 → 워커 프로세스당 1세트
+__all__ = ["app"]
 
 
 def _env_true(v: str | None) -> bool:
@@ -94,16 +39,29 @@ def _env_true(v: str | None) -> bool:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작 시
-    if not _env_true(os.getenv("SKIP_DB_INIT")):
+    #  - 스키마는 배포 단계에서 `python -m app.db.migrate` 로 1회만 적용 (기본: 부팅 시 DDL 없음)
+    #  - 로컬 개발에서 빈 DB에 테이블만 바로 만들려면 DB_INIT=1
+    if _env_true(os.getenv("DB_INIT")):
         print("INFO: Creating database and tables...")
         await create_db_and_tables()
         print("INFO: Database tables created successfully")
     else:
-        print("INFO: SKIP_DB_INIT=1 → DB 초기화 건너뜀")
+        print("INFO: DB 초기화 건너뜀 (스키마는 python -m app.db.migrate 로 적용)")
+
+    # 풀 연결 미리 열기 + 선택 컬럼 점검 1회 (실패해도 첫 요청에서 다시 연결/점검)
+    try:
+        await warm_pool()
+        async with AsyncSessionLocal() as session:
+            caps = await load_senti_caps(session)
+        print(f"INFO: Schema caps {caps}")
+    except Exception as e:
+        print(f"WARN: DB warm-up failed: {e}")
 
     yield
 
     # 종료 시
+    await close_reco_client()
+
     print("INFO: Disposing database engine...")
     await dispose_engine()
     print("INFO: Database engine disposed")
@@ -117,6 +75,7 @@ app = FastAPI(
     description="FastAPI + Supabase PostgreSQL with SQLModel",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=DefaultResponse,
 )
 
 # ---------------------------------------------------------------------
@@ -125,16 +84,19 @@ app = FastAPI(
 #   - 로컬 개발(URL)도 함께 허용
 # ---------------------------------------------------------------------
 frontend_url = os.getenv("FRONTEND_URL")  # 예) https://news-cleansing-front.vercel.app
-allow_origins = {
+_origins = {
     "http://localhost:3000",
     "http://127.0.0.1:3000",
 }
 if frontend_url:
-    allow_origins.add(frontend_url)
+    _origins.add(frontend_url.rstrip("/"))
+
+# import 시 1회 고정 (불변 tuple)
+ALLOW_ORIGINS: tuple[str, ...] = tuple(sorted(_origins))
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=list(allow_origins) if allow_origins else ["*"],
+    allow_origins=ALLOW_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],